@@ -1,7 +1,22 @@
 from .config import __version__, __author__, __license__
-from .cli import main, CinemaCLI
-from .scraper import TopCinemaScraper
-from .processor import VidTubeProcessor
+
+# Submodules load on first attribute access, so importing one piece (e.g. the
+# processor) doesn't drag in the CLI and API stacks
+_LAZY = {
+    "main": "cli",
+    "CinemaCLI": "cli",
+    "TopCinemaScraper": "scraper",
+    "VidTubeProcessor": "processor",
+}
+
+def __getattr__(name):
+    module = _LAZY.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    from importlib import import_module
+    value = getattr(import_module(f".{module}", __name__), name)
+    globals()[name] = value
+    return value
 
 __all__ = [
     "main",
@@ -1,16 +1,26 @@
-from fastapi import FastAPI, HTTPException, Query, Path
+from fastapi import FastAPI, HTTPException, Query, Path, Request, Response
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.concurrency import run_in_threadpool
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 from typing import List, Optional, Any, Dict
-from urllib.parse import urljoin
+from functools import lru_cache
+import asyncio
+import hashlib
+import itertools
+import time
 import re
+import soupsieve
 
 # Import existing scraper and our new processor
 from .scraper import TopCinemaScraper, clean_arabic_title
 from .processor import VidTubeProcessor
 
+# Response models are built once and never mutated
+_MODEL_CONFIG = ConfigDict(extra="ignore", frozen=True)
+
 class SearchResult(BaseModel):
+    model_config = _MODEL_CONFIG
+
     title: str
     original_title: Optional[str] = None
     url: str
@@ -21,6 +31,8 @@ class SearchResult(BaseModel):
     quality: Optional[str] = None
 
 class Episode(BaseModel):
+    model_config = _MODEL_CONFIG
+
     episode_number: str
     display_number: str
     title: str
@@ -29,6 +41,8 @@ class Episode(BaseModel):
     servers: List[dict] = []
 
 class Season(BaseModel):
+    model_config = _MODEL_CONFIG
+
     season_number: int
     display_label: str
     url: str
@@ -36,6 +50,8 @@ class Season(BaseModel):
     episodes: List[Episode] = []
 
 class ShowDetails(BaseModel):
+    model_config = _MODEL_CONFIG
+
     title: str
     original_title: Optional[str] = None
     url: str
@@ -50,24 +66,27 @@ class ShowDetails(BaseModel):
     servers: List[dict] = [] # For movies
 
 class StreamSource(BaseModel):
+    model_config = _MODEL_CONFIG
+
     server_number: int
     embed_url: str
     video_url: str
     headers: dict = {}
     mpv_command: str
 
+_TITLE_SELECTOR = soupsieve.compile("h2.title, h3.title, .Title, .product-title")
+
 class APITopCinemaScraper(TopCinemaScraper):
     def __init__(self):
         super().__init__()
         self.vidtube_processor = VidTubeProcessor(self.session)
         
     def _extract_vidtube_url(self, embed_url: str, referers: Optional[List[str]] = None) -> Optional[str]:
-        referers = referers or []
-        for ref in referers:
-            if ref:
-                video_url = self.vidtube_processor.extract(embed_url, referer=ref)
-                if video_url:
-                    return video_url
+        # Referers in priority order, then no referer; duplicates would only refetch
+        for ref in dict.fromkeys(ref for ref in referers or [] if ref):
+            video_url = self.vidtube_processor.extract(embed_url, referer=ref)
+            if video_url:
+                return video_url
         return self.vidtube_processor.extract(embed_url)
 
     def _parse_metadata(self, soup: Any, url: str) -> Dict:
@@ -77,7 +96,7 @@ class APITopCinemaScraper(TopCinemaScraper):
         if meta.get("title", "").strip().lower() == "topcinema":
             # Try to find a better title from breadcrumbs or other headers
             # Often .Title or .title class
-            candidates = soup.select("h2.title, h3.title, .Title, .product-title")
+            candidates = _TITLE_SELECTOR.select(soup)
             for c in candidates:
                 text = clean_show_title(c.get_text())
                 if text and text.lower() != "topcinema":
@@ -89,26 +108,24 @@ class APITopCinemaScraper(TopCinemaScraper):
              
         return meta
 
+    def _classify_type(self, url_lc: str, title: str) -> str:
+        # English URLs often have /series/anime-... which triggers series first in original logic
+        # We enforce anime check if 'anime' is anywhere in URL or title
+        if "anime" in url_lc or "انمي" in title or "anime" in title.lower():
+            return "anime"
+        return super()._classify_type(url_lc, title)
+
     def _parse_search_result(self, item) -> Optional[Dict]:
         res = super()._parse_search_result(item)
-        if not res: return None
-        
-        url = res.get("url", "")
-        title = res.get("title", "")
-        
-        # English URLs often have /series/anime-... which triggers series first in original logic
-        # We enforce anime check if 'anime' is in URL or title
-        if "anime" in url.lower() or "انمي" in title or "anime" in title.lower():
-            res["type"] = "anime"
-            
+        if res:
+            # Clean once here so response building doesn't repeat the regex work
+            res["cleaned_title"] = clean_show_title(res["title"])
         return res
 
     def _parse_episode_link(self, link_elem, url: str) -> Optional[Dict]:
-        if url and not url.startswith(('http:', 'https:')):
-            url = urljoin(self.base_url, url)
-        
-        # Filter out obviously bad links that might be caught
-        if '/category/' in url or '/genre/' in url:
+        # Filter out obviously bad links before the base parser does any work;
+        # it resolves relative URLs itself
+        if not url or '/category/' in url or '/genre/' in url:
             return None
             
         data = super()._parse_episode_link(link_elem, url)
@@ -133,33 +150,39 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
-def clean_show_title(title: str) -> str:
+_JUNK_PATTERNS = [
+    r'\b(?:1080p|720p|480p|360p)\b',
+    r'\b(?:WEB-DL|BluRay|HDTV|CAM)\b',
+    r'\b(?:x264|x265|HEVC)\b',
+    r'\b(?:\d{1,2}\.\d)\b',
+    r'[★⭐]\s*\d+\.?\d*',
+    r'\[\s*\d+\.?\d*\s*\]',
+    r'\b(?:Season|الموسم)\s*\d+',
+    r'\b(?:Episode|الحلقة)\s*\d+',
+]
+# One alternation so each title is scanned once instead of once per pattern
+_JUNK_RE = re.compile("(?:" + "|".join(_JUNK_PATTERNS) + ")", re.IGNORECASE)
+_WS_RE = re.compile(r'\s+')
+
+def clean_show_title(title: Optional[str]) -> str:
+    # Normalize before the cache boundary so the cache key is always a str
+    return _clean_show_title(title or "")
+
+@lru_cache(maxsize=4096)
+def _clean_show_title(title: str) -> str:
     cleaned = clean_arabic_title(title)
-    
+
     if cleaned.lower() == 'topcinema':
         return ""
 
-    junk_patterns = [
-        r'\b(?:1080p|720p|480p|360p)\b',
-        r'\b(?:WEB-DL|BluRay|HDTV|CAM)\b',
-        r'\b(?:x264|x265|HEVC)\b',
-        r'\b(?:\d{1,2}\.\d)\b',
-        r'[★⭐]\s*\d+\.?\d*',
-        r'\[\s*\d+\.?\d*\s*\]',
-        r'\b(?:Season|الموسم)\s*\d+',
-        r'\b(?:Episode|الحلقة)\s*\d+',
-    ]
-    
-    for pattern in junk_patterns:
-        cleaned = re.sub(pattern, '', cleaned, flags=re.IGNORECASE)
-    
-    cleaned = re.sub(r'\s+', ' ', cleaned).strip()
-    return cleaned
+    cleaned = _JUNK_RE.sub('', cleaned)
+    return _WS_RE.sub(' ', cleaned).strip()
 
+# Rows are built from already-parsed scraper dicts, so skip per-item validation
 def transform_search_result(res: dict) -> SearchResult:
     meta = res.get("metadata", {})
-    return SearchResult(
-        title=clean_show_title(res["title"]),
+    return SearchResult.model_construct(
+        title=res.get("cleaned_title") or clean_show_title(res["title"]),
         original_title=res["title"], # Keep original just in case
         url=res["url"],
         type=res["type"],
@@ -169,38 +192,160 @@ def transform_search_result(res: dict) -> SearchResult:
         quality=meta.get("quality")
     )
 
+def transform_episode(ep: dict) -> Episode:
+    return Episode.model_construct(
+        episode_number=str(ep.get("episode_number", "?")),
+        display_number=ep.get("display_number", ""),
+        title=ep.get("title", ""),
+        url=ep["url"],
+        is_special=ep.get("is_special", False),
+        servers=[]
+    )
+
+# TopCinema pages change rarely, so scraped results are reused for a while
+CACHE_TTL = 900
+CACHE_MAX_ENTRIES = 1024
+# Empty results are kept briefly too, so requests queued behind a miss don't refetch
+EMPTY_CACHE_TTL = 30
+# An empty result may just be an upstream hiccup, don't let browsers/CDNs hold it for long
+EMPTY_CACHE_CONTROL = f"public, max-age={EMPTY_CACHE_TTL}"
+CACHE_CONTROL = f"public, max-age={CACHE_TTL}, stale-while-revalidate=300"
+_cache: Dict[tuple, tuple] = {}
+_inflight: Dict[tuple, asyncio.Lock] = {}
+# Bumped on every store so a refreshed entry never reuses an old ETag
+_cache_version = itertools.count(1)
+
+def _cache_entry(key: tuple) -> Optional[tuple]:
+    entry = _cache.get(key)
+    if entry and entry[0] > time.monotonic():
+        return entry
+    return None
+
+async def cached_call(key: tuple, func, *args):
+    entry = _cache_entry(key)
+    if entry:
+        return entry[1]
+
+    # One upstream fetch per key; concurrent requests wait for it
+    lock = _inflight.get(key)
+    if lock is None:
+        lock = _inflight[key] = asyncio.Lock()
+    try:
+        async with lock:
+            entry = _cache_entry(key)
+            if entry:
+                return entry[1]
+
+            value = await run_in_threadpool(func, *args)
+            if len(_cache) >= CACHE_MAX_ENTRIES:
+                _cache.pop(next(iter(_cache)))
+            ttl = CACHE_TTL if value else EMPTY_CACHE_TTL
+            _cache[key] = (time.monotonic() + ttl, value, next(_cache_version))
+            return value
+    finally:
+        # A later request may have registered a new lock under this key already
+        if _inflight.get(key) is lock:
+            del _inflight[key]
+
+def cache_etag(*keys: tuple) -> Optional[str]:
+    # Only responses built entirely from cached entries get a validator
+    h = hashlib.blake2b(digest_size=8)
+    for key in keys:
+        entry = _cache_entry(key)
+        if not entry or not entry[1]:
+            return None
+        h.update(f"{key!r}:{entry[2]};".encode())
+    return f'"{h.hexdigest()}"'
+
+def etag_matches(request: Request, etag: Optional[str]) -> bool:
+    if not etag:
+        return False
+    header = request.headers.get("if-none-match", "")
+    if header.strip() == "*":
+        return True
+    # Weak comparison, as RFC 9110 asks for If-None-Match
+    for tag in header.split(","):
+        tag = tag.strip()
+        if tag.startswith("W/"):
+            tag = tag[2:]
+        if tag == etag:
+            return True
+    return False
+
+def set_cache_headers(response: Response, etag: Optional[str] = None, empty: bool = False):
+    response.headers["Cache-Control"] = EMPTY_CACHE_CONTROL if empty else CACHE_CONTROL
+    if etag:
+        response.headers["ETag"] = etag
+
+def not_modified(etag: str) -> Response:
+    response = Response(status_code=304)
+    set_cache_headers(response, etag)
+    return response
+
+def load_season(url: str) -> dict:
+    season = {"url": url}
+    scraper.fetch_season_episodes(season)
+    return season if season.get("episodes") else {}
+
 @app.get("/health")
 async def health_check():
     return {"status": "ok", "domain": scraper.base_url}
 
 @app.get("/search", response_model=List[SearchResult])
 async def search(
+    request: Request,
+    response: Response,
     q: str = Query(..., min_length=1),
     type: Optional[str] = Query(None, pattern="^(movie|series|anime)$")
 ):
-    results = await run_in_threadpool(scraper.search, q, type)
+    key = ("search", q, type)
+    results = await cached_call(key, scraper.search, q, type)
+    etag = cache_etag(key)
+    if etag_matches(request, etag):
+        return not_modified(etag)
+    set_cache_headers(response, etag, empty=not results)
     return [transform_search_result(r) for r in results if r]
 
 @app.get("/show/details", response_model=ShowDetails)
-async def get_show_details(url: str = Query(..., alias="url")):
-    details = await run_in_threadpool(scraper.get_show_details, url)
+async def get_show_details(
+    request: Request,
+    response: Response,
+    url: str = Query(..., alias="url"),
+    eager: bool = Query(False, description="Also fetch the episodes of every season")
+):
+    etag_keys = [("details", url)]
+    details = await cached_call(etag_keys[0], scraper.get_show_details, url)
     
     if not details:
         raise HTTPException(status_code=404, detail="Show not found")
 
+    seasons = details.get("seasons") or []
+    loaded = [{}] * len(seasons)
+    if eager and seasons:
+        # Seasons are independent pages, fetch them concurrently
+        season_keys = [("season", s["url"]) for s in seasons]
+        loaded = await asyncio.gather(*(
+            cached_call(key, load_season, key[1]) for key in season_keys
+        ))
+        etag_keys.extend(season_keys)
+
+    etag = cache_etag(*etag_keys)
+    if etag_matches(request, etag):
+        return not_modified(etag)
+
     seasons_data = []
-    if "seasons" in details:
-        for s in details["seasons"]:
-            season_obj = Season(
-                season_number=s["season_number"],
-                display_label=s["display_label"],
-                url=s["url"],
-                poster=s.get("poster"),
-                episodes=[] 
-            )
-            seasons_data.append(season_obj)
+    for s, season_data in zip(seasons, loaded):
+        season_obj = Season(
+            season_number=s["season_number"],
+            display_label=s["display_label"],
+            url=s["url"],
+            poster=season_data.get("poster") or s.get("poster"),
+            episodes=[transform_episode(ep) for ep in season_data.get("episodes", [])]
+        )
+        seasons_data.append(season_obj)
 
     clean_title = clean_show_title(details.get("title", ""))
+    set_cache_headers(response, etag)
 
     return ShowDetails(
         title=clean_title,
@@ -219,33 +364,24 @@ async def get_show_details(url: str = Query(..., alias="url")):
 
 @app.get("/season/episodes", response_model=List[Episode])
 async def get_season_episodes(
+    response: Response,
     url: str = Query(...)
 ):
-    season_dummy = {"url": url}
-    episodes = await run_in_threadpool(scraper.fetch_season_episodes, season_dummy)
+    season = await cached_call(("season", url), load_season, url)
+    episodes = season.get("episodes")
     
     if not episodes:
         return []
 
-    return [
-        Episode(
-            episode_number=str(ep.get("episode_number", "?")),
-            display_number=ep.get("display_number", ""),
-            title=ep.get("title", ""),
-            url=ep["url"],
-            is_special=ep.get("is_special", False),
-            servers=[]
-        ) for ep in episodes
-    ]
+    set_cache_headers(response)
+    return [transform_episode(ep) for ep in episodes]
 
 @app.get("/stream/resolve", response_model=StreamSource)
 async def resolve_stream(
     url: str = Query(..., description="Episode/Movie watch URL")
 ):
     content_dummy = {"url": url}
-    
-    local_scraper = APITopCinemaScraper()
-    servers = await run_in_threadpool(local_scraper.fetch_episode_servers, content_dummy)
+    servers = await run_in_threadpool(scraper.fetch_episode_servers, content_dummy)
     
     if not servers:
         raise HTTPException(status_code=404, detail="No working VidTube servers found")
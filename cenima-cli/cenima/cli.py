@@ -9,35 +9,145 @@ import asyncio
 import time
 import threading
 import platform
-import urllib.request
+from functools import lru_cache
 from pathlib import Path
-from typing import List, Any, Optional, Dict
+from types import MappingProxyType
+from typing import List, Any, Optional, Tuple
 from rich.console import Console, Group
 from rich.prompt import Prompt
 from rich.text import Text
-from rich.progress import Progress, SpinnerColumn, TextColumn, BarColumn, TimeElapsedColumn
-from rich.live import Live
 from rich.table import Table
 from rich.markup import escape
 from rich.panel import Panel
-from rich.style import Style
+from curl_cffi import requests
 
 from .api import scraper, clean_show_title
 from .config import (
     __version__, __author__, __license__,
     CONFIG_DIR, CONFIG_FILE,
     ASCII_ART, GOODBYE_ART,
-    THEMES, DEFAULT_THEME, SPINNERS
+    THEMES, DEFAULT_THEME, SPINNERS, Theme
 )
 
 CONSOLE = Console()
+# Neither changes during a run, so read them once instead of on every banner repaint
+try:
+    _OS_NAME = f"{platform.system()} {platform.release()}"
+except Exception:
+    _OS_NAME = "Unknown"
+_SHELL_NAME = os.environ.get('SHELL', 'Unknown').rsplit('/', 1)[-1]
+_ANSI_RESET = "\033[0m"
+_ANSI_GOLD = "\033[38;2;218;165;32m"
+_ANSI_WHITE = "\033[37m"
+# Checked in order, first match wins
+_QUALITY_COLORS = (("CAM", "\033[31m"), ("BLURAY", "\033[36m"), ("WEB", "\033[32m"))
+
+
+def _type_prefix(show_type: str, emoji: str, color: str) -> str:
+    return f"{emoji} \033[{color}m{show_type.title().ljust(8)}{_ANSI_RESET}│ "
+
+
+def _hex_to_rgb(hex_color: str) -> str:
+    hex_color = hex_color.lstrip('#')
+    r, g, b = int(hex_color[0:2], 16), int(hex_color[2:4], 16), int(hex_color[4:6], 16)
+    return f"{r};{g};{b}"
+
+
+# fzf rows are rebuilt on every picker open, so the escape-heavy parts are built once here
+_TYPE_PREFIX = {
+    "movie": _type_prefix("movie", "🎬", "34"),
+    "series": _type_prefix("series", "📺", "35"),
+    "anime": _type_prefix("anime", "🎌", "36"),
+}
+_THEME_SWATCHES = {
+    name: f"\033[38;2;{_hex_to_rgb(colors.primary)}m● {name.title()}"
+    for name, colors in THEMES.items()
+}
+
+# Shared read-only fallback for missing metadata, saves a fresh {} per lookup
+_EMPTY = MappingProxyType({})
 GITHUB_REPO_URL = "https://github.com/np4abdou1/cenima-cli"
 GITHUB_API_URL = "https://api.github.com/repos/np4abdou1/cenima-cli"
 
+# One keep-alive session for GitHub, so stars refreshes skip the TLS handshake
+_github_session = None
+_github_session_lock = threading.Lock()
+
+
+def _get_github_session():
+    global _github_session
+    with _github_session_lock:
+        if _github_session is None:
+            _github_session = requests.Session(headers={'Accept': 'application/vnd.github.v3+json'})
+        return _github_session
+
+
+# Set from X-RateLimit-Reset once GitHub reports no requests left
+_github_rate_limited_until = 0.0
+
+
+def _github_get(url: str, attempts: int = 2, backoff: float = 0.2):
+    global _github_rate_limited_until
+    if time.time() < _github_rate_limited_until:
+        raise RuntimeError("GitHub API rate limit exhausted")
+    
+    session = _get_github_session()
+    for attempt in range(attempts):
+        last = attempt + 1 == attempts
+        try:
+            response = session.get(url, timeout=3)
+        except Exception:
+            if last:
+                raise
+        else:
+            if response.headers.get("X-RateLimit-Remaining") == "0":
+                try:
+                    _github_rate_limited_until = float(response.headers.get("X-RateLimit-Reset", 0))
+                except ValueError:
+                    pass
+            # Only server errors are worth retrying, a 403/404 won't change
+            if response.status_code < 500 or last:
+                response.raise_for_status()
+                return response
+        time.sleep(backoff * (4 ** attempt))
+
+
+_LEADING_NUM_RE = re.compile(r'^[\s\.\-:]*\d+\s*[\.\-:]\s*', re.IGNORECASE)
+
+
+@lru_cache(maxsize=256)
+def _num_prefix_re(label: str):
+    return re.compile(rf'^(?:Episode\s+)?0*{re.escape(label)}\s*[\.\-:]\s*', re.IGNORECASE)
+
+
+def _atomic_write_text(path: Path, text: str):
+    # Write next to the target then swap it in, so readers never see a torn file
+    tmp = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+    try:
+        tmp.write_text(text)
+        os.replace(tmp, path)
+    except Exception:
+        tmp.unlink(missing_ok=True)
+        raise
+
+
+@lru_cache(maxsize=1)
+def _missing_deps() -> Tuple[str, ...]:
+    return tuple(tool for tool in ("fzf", "mpv") if not shutil.which(tool))
+
+
+STARS_CACHE_DURATION = 3600
+
 
 def get_github_stars() -> int:
+    # Memoized per cache window, so repaints within a run never touch the disk again
+    return _stars_bucketed(int(time.time() // STARS_CACHE_DURATION))
+
+
+@lru_cache(maxsize=1)
+def _stars_bucketed(bucket: int) -> int:
     cache_file = CONFIG_DIR / "stars_cache.json"
-    cache_duration = 3600
+    cache_duration = STARS_CACHE_DURATION
     
     if cache_file.exists():
         try:
@@ -48,22 +158,20 @@ def get_github_stars() -> int:
             pass
     
     try:
-        req = urllib.request.Request(GITHUB_API_URL)
-        req.add_header('Accept', 'application/vnd.github.v3+json')
-        with urllib.request.urlopen(req, timeout=3) as response:
-            data = json.loads(response.read().decode())
-            stars = data.get('stargazers_count', 0)
-            
-            try:
-                CONFIG_DIR.mkdir(parents=True, exist_ok=True)
-                cache_file.write_text(json.dumps({
-                    'stars': stars,
-                    'timestamp': time.time()
-                }))
-            except Exception:
-                pass
-            
-            return stars
+        response = _github_get(GITHUB_API_URL)
+        data = response.json()
+        stars = data.get('stargazers_count', 0)
+        
+        try:
+            CONFIG_DIR.mkdir(parents=True, exist_ok=True)
+            _atomic_write_text(cache_file, json.dumps({
+                'stars': stars,
+                'timestamp': time.time()
+            }))
+        except Exception:
+            pass
+        
+        return stars
     except Exception:
         if cache_file.exists():
             try:
@@ -74,6 +182,10 @@ def get_github_stars() -> int:
         return 0
 
 
+# Last parsed config as (st_mtime_ns, data), reused until the file changes
+_CONFIG_CACHE = None
+
+
 class Config:
     
     def __init__(self):
@@ -81,27 +193,36 @@ class Config:
         self.load()
     
     def load(self):
+        global _CONFIG_CACHE
         try:
-            if CONFIG_FILE.exists():
-                data = json.loads(CONFIG_FILE.read_text())
-                self.theme = data.get("theme", DEFAULT_THEME)
+            mtime = CONFIG_FILE.stat().st_mtime_ns
+        except OSError:
+            return
+        try:
+            if _CONFIG_CACHE is None or _CONFIG_CACHE[0] != mtime:
+                _CONFIG_CACHE = (mtime, json.loads(CONFIG_FILE.read_text()))
+            self.theme = _CONFIG_CACHE[1].get("theme", DEFAULT_THEME)
         except Exception:
             pass
     
     def save(self):
+        global _CONFIG_CACHE
         try:
             CONFIG_DIR.mkdir(parents=True, exist_ok=True)
-            CONFIG_FILE.write_text(json.dumps({"theme": self.theme}, indent=2))
+            data = {"theme": self.theme}
+            _atomic_write_text(CONFIG_FILE, json.dumps(data, indent=2))
+            _CONFIG_CACHE = (CONFIG_FILE.stat().st_mtime_ns, data)
         except Exception:
             pass
     
-    def get_theme(self) -> Dict:
+    def get_theme(self) -> Theme:
         return THEMES.get(self.theme, THEMES[DEFAULT_THEME])
 
 
 class CinemaCLI:
     def __init__(self):
         self.config = Config()
+        self._theme = self.config.get_theme()
         self.picker_hint = "↑↓ navigate • Enter select • Esc back"
         self.current_show_title = ""
         self.current_overview_panel = None
@@ -109,24 +230,31 @@ class CinemaCLI:
         self.current_episode_index = 0
         self.current_season = None
         self.github_stars = None  # Lazy load
-        self.check_deps()
+        self._stars_task = None
+        self._prefetch = None  # (episode, future) for the next episode's servers
     
     @property
-    def theme(self) -> Dict:
-        return self.config.get_theme()
+    def theme(self) -> Theme:
+        # Only theme_selector changes the theme, and it refreshes this
+        return self._theme
     
     def check_deps(self):
-        missing = []
-        if not shutil.which("fzf"):
-            missing.append("fzf")
-        if not shutil.which("mpv"):
-            missing.append("mpv")
-        
+        missing = _missing_deps()
         if missing:
             CONSOLE.print(f"[bold red]✗ Missing dependencies:[/bold red] {', '.join(missing)}")
             CONSOLE.print("[dim]Install with: sudo apt install fzf mpv[/dim]")
             sys.exit(1)
     
+    def _spinner(self, spinner: str):
+        # rich.progress is only needed once a fetch starts, keep it off the startup path
+        from rich.progress import Progress, SpinnerColumn, TextColumn
+        return Progress(
+            SpinnerColumn(spinner),
+            TextColumn("[progress.description]{task.description}"),
+            console=CONSOLE,
+            transient=True
+        )
+    
     def log(self, emoji: str, message: str, style: str = "dim"):
         CONSOLE.print(f"[{style}]{emoji} {message}[/{style}]")
     
@@ -138,69 +266,41 @@ class CinemaCLI:
         grid.add_column()
         grid.add_column(justify="left", vertical="middle")
         
-        art = Text(ASCII_ART, style=theme["primary"])
-        
-        info_text = Text()
-        info_text.append("╭────────────────────╮\n", style=theme["accent"])
-        info_text.append("│  ", style=theme["accent"])
-        info_text.append("cenima-cli", style=f"bold {theme['primary']}")
-        info_text.append(f"  v{__version__}", style="dim")
-        info_text.append("  │\n", style=theme["accent"])
-        info_text.append("╰────────────────────╯\n", style=theme["accent"])
-        info_text.append("\n")
+        art = Text(ASCII_ART, style=theme.primary)
         
-        info_text.append("👤 ", style=theme['accent'])
-        info_text.append("Author    ", style=f"bold {theme['secondary']}")
-        info_text.append(f"│ {__author__}\n")
-        
-        info_text.append("💻 ", style=theme['accent'])
-        info_text.append("OS        ", style=f"bold {theme['secondary']}")
-        try:
-            info_text.append(f"│ {platform.system()} {platform.release()}\n")
-        except:
-            info_text.append("│ Unknown\n")
-        
-        info_text.append("🎨 ", style=theme['accent'])
-        info_text.append("Theme     ", style=f"bold {theme['secondary']}")
-        info_text.append(f"│ {self.config.theme.title()}\n")
-        
-        shell = os.environ.get('SHELL', 'Unknown')
-        if '/' in shell:
-            shell = shell.split('/')[-1]
-        info_text.append("🐚 ", style=theme['accent'])
-        info_text.append("Shell     ", style=f"bold {theme['secondary']}")
-        info_text.append(f"│ {shell}\n")
+        if self.github_stars is None:
+            if self._stars_task is None:
+                self.github_stars = get_github_stars()
+            elif self._stars_task.done() and not self._stars_task.cancelled():
+                self.github_stars = self._stars_task.result()
         
-
         if self.github_stars is None:
-            self.github_stars = get_github_stars()
-        
-        info_text.append("⭐ ", style="#daa520")
-        info_text.append("Stars     ", style=f"bold {theme['secondary']}")
-        info_text.append("│ ", style="")
-        if self.github_stars > 0:
-            info_text.append(str(self.github_stars), style="bold #daa520")
-            info_text.append(" (Thank you!)\n", style="dim")
+            # Still fetching in the background, filled in on a later repaint
+            stars = "[dim]…[/dim]"
+        elif self.github_stars > 0:
+            stars = f"[bold #daa520]{self.github_stars}[/bold #daa520][dim] (Thank you!)[/dim]"
         else:
-            info_text.append("0", style="#daa520")
-            info_text.append(" (Star us!)\n", style="dim")
+            stars = "[#daa520]0[/#daa520][dim] (Star us!)[/dim]"
         
-        info_text.append("🔗 ", style=theme['accent'])
-        info_text.append("Repository", style=f"bold {theme['secondary']}")
-        info_text.append("\n   ", style="")
         # Make URL clickable in supported terminals, show a shorter display text
         short_repo = GITHUB_REPO_URL.replace("https://", "").replace("http://", "")
-        # Use from_markup to properly parse the link markup
-        link_text = Text.from_markup(f"[link={GITHUB_REPO_URL}]{short_repo}[/link]", style=f"italic {theme['accent']}")
-        info_text.append_text(link_text)
-        info_text.append("\n")
-
-
         
-        info_text.append("\n")
-        info_text.append("💡 Type ", style="dim")
-        info_text.append("/help", style=f"bold {theme['accent']}")
-        info_text.append(" for commands", style="dim")
+        # Built as one markup string so rich parses the whole block in a single pass
+        primary, secondary, accent = theme.primary, theme.secondary, theme.accent
+        label = f"bold {secondary}"
+        info_text = Text.from_markup(
+            f"[{accent}]╭────────────────────╮\n│  [/{accent}]"
+            f"[bold {primary}]cenima-cli[/bold {primary}][dim]  v{escape(__version__)}[/dim]"
+            f"[{accent}]  │\n╰────────────────────╯\n[/{accent}]\n"
+            f"[{accent}]👤 [/{accent}][{label}]Author    [/{label}]│ {escape(__author__)}\n"
+            f"[{accent}]💻 [/{accent}][{label}]OS        [/{label}]│ {escape(_OS_NAME)}\n"
+            f"[{accent}]🎨 [/{accent}][{label}]Theme     [/{label}]│ {escape(self.config.theme.title())}\n"
+            f"[{accent}]🐚 [/{accent}][{label}]Shell     [/{label}]│ {escape(_SHELL_NAME)}\n"
+            f"[#daa520]⭐ [/#daa520][{label}]Stars     [/{label}]│ {stars}\n"
+            f"[{accent}]🔗 [/{accent}][{label}]Repository[/{label}]\n   "
+            f"[italic {accent}][link={GITHUB_REPO_URL}]{short_repo}[/link][/italic {accent}]\n"
+            f"\n[dim]💡 Type [/dim][bold {accent}]/help[/bold {accent}][dim] for commands[/dim]"
+        )
         
         grid.add_row(art, info_text)
         
@@ -210,8 +310,8 @@ class CinemaCLI:
     def goodbye(self):
         CONSOLE.clear()
         theme = self.theme
-        CONSOLE.print(Text(GOODBYE_ART, style=theme["primary"]))
-        CONSOLE.print(f"[{theme['secondary']}]Thanks for using cenima-cli![/{theme['secondary']}]")
+        CONSOLE.print(Text(GOODBYE_ART, style=theme.primary))
+        CONSOLE.print(f"[{theme.secondary}]Thanks for using cenima-cli![/{theme.secondary}]")
     
     def _show_picker_intro(self, title: Optional[str] = None, subtitle: Optional[str] = None):
         CONSOLE.clear()
@@ -219,14 +319,14 @@ class CinemaCLI:
             return
         theme = self.theme
         if title:
-            CONSOLE.print(f"[bold {theme['primary']}]{escape(title)}[/bold {theme['primary']}]")
+            CONSOLE.print(f"[bold {theme.primary}]{escape(title)}[/bold {theme.primary}]")
         if subtitle:
             CONSOLE.print(f"[dim]{escape(subtitle)}[/dim]")
         CONSOLE.print("")
     
     def _print_focus_panel(self, title: str, subtitle: Optional[str] = None):
         theme = self.theme
-        CONSOLE.print(f"[bold {theme['primary']}]{escape(title)}[/bold {theme['primary']}]")
+        CONSOLE.print(f"[bold {theme.primary}]{escape(title)}[/bold {theme.primary}]")
         if subtitle:
             CONSOLE.print(f"[dim]{escape(subtitle)}[/dim]")
         CONSOLE.print("")
@@ -239,8 +339,9 @@ class CinemaCLI:
         title: Optional[str] = None,
         subtitle: Optional[str] = None
     ) -> Optional[int]:
-        numbered = [f"{i}\t{items[i]}" for i in range(len(items))]
-        input_str = "\n".join(numbered)
+        # Checked here rather than at startup so /help and /version don't walk PATH
+        self.check_deps()
+        input_str = "\n".join(f"{i}\t{item}" for i, item in enumerate(items))
         
         self._show_picker_intro(title, subtitle)
         
@@ -249,24 +350,28 @@ class CinemaCLI:
             'fzf', '--ansi', '--layout=reverse', '--height=80%',
             f'--prompt={prompt}',
             '--delimiter=\t', '--with-nth=2',
-            f'--color=fg:-1,bg:-1,hl:{theme["accent"]},fg+:-1,bg+:-1,hl+:{theme["primary"]}',
-            f'--color=info:{theme["secondary"]},prompt:{theme["primary"]},pointer:{theme["primary"]}',
-            f'--color=marker:{theme["accent"]},spinner:{theme["primary"]},header:{theme["secondary"]}'
+            f'--color=fg:-1,bg:-1,hl:{theme.accent},fg+:-1,bg+:-1,hl+:{theme.primary}',
+            f'--color=info:{theme.secondary},prompt:{theme.primary},pointer:{theme.primary}',
+            f'--color=marker:{theme.accent},spinner:{theme.primary},header:{theme.secondary}'
         ]
         if header:
             args.append(f'--header={header}')
         
         try:
-            process = subprocess.run(args, input=input_str, capture_output=True, text=True)
+            # Binary pipes: encode the list once, fzf only sends back the picked line
+            process = subprocess.Popen(
+                args, stdin=subprocess.PIPE, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL
+            )
+            stdout, _ = process.communicate(input_str.encode("utf-8"))
             CONSOLE.clear()
             
             if process.returncode == 0:
-                selected = process.stdout.strip()
+                # Only the index prefix matters, so parse it straight from the bytes
+                selected = stdout.strip()
                 if not selected:
                     return None
-                parts = selected.split('\t', 1)
                 try:
-                    idx = int(parts[0])
+                    idx = int(selected.split(b'\t', 1)[0])
                     if 0 <= idx < len(items):
                         return idx
                 except ValueError:
@@ -289,6 +394,20 @@ class CinemaCLI:
         subtitle: Optional[str] = None,
         header: Optional[str] = None
     ) -> Optional[Any]:
+        selection = self.run_fzf_objects_indexed(items, format_func, prompt, title, subtitle, header)
+        if selection is not None:
+            return selection[1]
+        return None
+    
+    def run_fzf_objects_indexed(
+        self,
+        items: List[Any],
+        format_func,
+        prompt: str = "❯ ",
+        title: Optional[str] = None,
+        subtitle: Optional[str] = None,
+        header: Optional[str] = None
+    ) -> Optional[Tuple[int, Any]]:
         if not items:
             return None
         
@@ -296,7 +415,7 @@ class CinemaCLI:
         idx = self.run_fzf(choices, prompt, header=header, title=title, subtitle=subtitle)
         
         if idx is not None:
-            return items[idx]
+            return idx, items[idx]
         return None
     
     def handle_command(self, query: str) -> bool:
@@ -320,9 +439,8 @@ class CinemaCLI:
         theme_names = list(THEMES.keys())
         
         def fmt_theme(name):
-            colors = THEMES[name]
             indicator = " ★" if name == self.config.theme else ""
-            return f"\033[38;2;{self._hex_to_rgb(colors['primary'])}m● {name.title()}{indicator}\033[0m"
+            return f"{_THEME_SWATCHES[name]}{indicator}{_ANSI_RESET}"
         
         idx = self.run_fzf(
             [fmt_theme(t) for t in theme_names],
@@ -334,43 +452,47 @@ class CinemaCLI:
         if idx is not None:
             self.config.theme = theme_names[idx]
             self.config.save()
-            self.log("✓", f"Theme changed to {theme_names[idx].title()}", f"bold {self.theme['primary']}")
+            self._theme = self.config.get_theme()
+            self.log("✓", f"Theme changed to {theme_names[idx].title()}", f"bold {self.theme.primary}")
             time.sleep(0.5)
     
-    def _hex_to_rgb(self, hex_color: str) -> str:
-        hex_color = hex_color.lstrip('#')
-        r, g, b = int(hex_color[0:2], 16), int(hex_color[2:4], 16), int(hex_color[4:6], 16)
-        return f"{r};{g};{b}"
-    
     def show_help(self):
         self.banner()
         theme = self.theme
         
-        CONSOLE.print(f"[bold {theme['primary']}]📚 Commands[/bold {theme['primary']}]")
-        CONSOLE.print("[dim]/theme   - Change color theme[/dim]")
-        CONSOLE.print("[dim]/help    - Show this help[/dim]")
-        CONSOLE.print("[dim]/version - Show version info[/dim]")
-        CONSOLE.print("[dim]exit     - Quit the application[/dim]")
-        CONSOLE.print("")
-        CONSOLE.print(f"[bold {theme['primary']}]🎮 Controls[/bold {theme['primary']}]")
-        CONSOLE.print("[dim]↑/↓      - Navigate lists[/dim]")
-        CONSOLE.print("[dim]Enter    - Select item[/dim]")
-        CONSOLE.print("[dim]Esc      - Go back[/dim]")
-        CONSOLE.print("[dim]Type     - Filter results[/dim]")
-        CONSOLE.print("")
+        heading = f"bold {theme.primary}"
+        # One print instead of a dozen, rich only has to lay out the block once
+        CONSOLE.print("\n".join([
+            f"[{heading}]📚 Commands[/{heading}]",
+            "[dim]/theme   - Change color theme[/dim]",
+            "[dim]/help    - Show this help[/dim]",
+            "[dim]/version - Show version info[/dim]",
+            "[dim]exit     - Quit the application[/dim]",
+            "",
+            f"[{heading}]🎮 Controls[/{heading}]",
+            "[dim]↑/↓      - Navigate lists[/dim]",
+            "[dim]Enter    - Select item[/dim]",
+            "[dim]Esc      - Go back[/dim]",
+            "[dim]Type     - Filter results[/dim]",
+            "",
+        ]))
         input("Press Enter to continue...")
     
     async def search_flow(self):
+        # Fetch stars off the render path so the first banner doesn't wait on GitHub
+        if self.github_stars is None and self._stars_task is None:
+            self._stars_task = asyncio.create_task(asyncio.to_thread(get_github_stars))
+        
         while True:
             self.banner()
             theme = self.theme
             
-            CONSOLE.print(f"[{theme['accent']}]╭[/{theme['accent']}]" + f"[{theme['accent']}]─[/{theme['accent']}]" * 15 + f"[{theme['accent']}] 🔍 Search [/{theme['accent']}]" + f"[{theme['accent']}]─[/{theme['accent']}]" * 15 + f"[{theme['accent']}]╮[/{theme['accent']}]")
+            CONSOLE.print(f"[{theme.accent}]╭[/{theme.accent}]" + f"[{theme.accent}]─[/{theme.accent}]" * 15 + f"[{theme.accent}] 🔍 Search [/{theme.accent}]" + f"[{theme.accent}]─[/{theme.accent}]" * 15 + f"[{theme.accent}]╮[/{theme.accent}]")
             
-            CONSOLE.print(f"[{theme['accent']}]│[/{theme['accent']}]", end="")
-            query = Prompt.ask(f"[{theme['primary']}]❯[/{theme['primary']}]", console=CONSOLE)
+            CONSOLE.print(f"[{theme.accent}]│[/{theme.accent}]", end="")
+            query = Prompt.ask(f"[{theme.primary}]❯[/{theme.primary}]", console=CONSOLE)
             
-            CONSOLE.print(f"[{theme['accent']}]╰[/{theme['accent']}]" + f"[dim {theme['accent']}]─ movies • series • anime ─[/dim {theme['accent']}]" + f"[{theme['accent']}]╯[/{theme['accent']}]")
+            CONSOLE.print(f"[{theme.accent}]╰[/{theme.accent}]" + f"[dim {theme.accent}]─ movies • series • anime ─[/dim {theme.accent}]" + f"[{theme.accent}]╯[/{theme.accent}]")
             
             if query.lower() in ('exit', 'quit', '/exit', '/quit'):
                 self.goodbye()
@@ -382,67 +504,71 @@ class CinemaCLI:
             
             self.log("🔄", "Fetching results...")
             
-            with Progress(
-                SpinnerColumn("dots2"),
-                TextColumn("[progress.description]{task.description}"),
-                console=CONSOLE,
-                transient=True
-            ) as progress:
-                task = progress.add_task(f"[{theme['primary']}]Searching...", total=None)
+            with self._spinner("dots2") as progress:
+                task = progress.add_task(f"[{theme.primary}]Searching...", total=None)
                 try:
                     results = await asyncio.to_thread(scraper.search, query)
                 except Exception as e:
-                    CONSOLE.print(f"[{theme['error']}]✗ Search failed: {e}[/{theme['error']}]")
+                    CONSOLE.print(f"[{theme.error}]✗ Search failed: {e}[/{theme.error}]")
                     await asyncio.sleep(2)
                     continue
             
             if not results:
-                self.log("⚠️", "No results found", f"{theme['error']}")
+                self.log("⚠️", "No results found", f"{theme.error}")
                 await asyncio.sleep(1.5)
                 continue
             
-            def get_relevance_score(result, search_query):
-                title = clean_show_title(result['title']).lower()
-                query_lower = search_query.lower()
-                rating = result.get('metadata', {}).get('rating') or result.get('metadata', {}).get('imdb_rating') or 0
+            query_lower = query.lower()
+            
+            def get_relevance_bucket(result):
+                # Keep the cleaned title on the result so fmt_res doesn't clean it again
+                clean_t = result.get('cleaned_title')
+                if clean_t is None:
+                    clean_t = result['cleaned_title'] = clean_show_title(result['title'])
+                title = clean_t.lower()
                 
                 if title == query_lower:
-                    return (0, -rating)
+                    return 0
                 elif title.startswith(query_lower):
-                    return (1, -rating)
+                    return 1
                 elif query_lower in title:
-                    return (2, -rating)
+                    return 2
                 else:
-                    return (3, -rating)
+                    return 3
             
-            results.sort(key=lambda r: get_relevance_score(r, query))
+            def get_rating_key(result):
+                metadata = result.get('metadata') or _EMPTY
+                return -(metadata.get('rating') or metadata.get('imdb_rating') or 0)
+            
+            # Partition by match quality in one pass, then only sort within each bucket
+            buckets = [[], [], [], []]
+            for r in results:
+                buckets[get_relevance_bucket(r)].append(r)
+            results = []
+            for bucket in buckets:
+                bucket.sort(key=get_rating_key)
+                results.extend(bucket)
             
             def fmt_res(r):
-                type_emoji = "🎬" if r['type'] == 'movie' else "📺" if r['type'] == 'series' else "🎌"
-                type_color = "34" if r['type'] == 'movie' else "35" if r['type'] == 'series' else "36"
-                clean_t = clean_show_title(r['title'])
+                show_type = r['type']
+                prefix = _TYPE_PREFIX.get(show_type) or _type_prefix(show_type, "🎌", "36")
+                clean_t = r.get('cleaned_title') or clean_show_title(r['title'])
                 
-                year = r.get('metadata', {}).get('year')
+                metadata = r.get('metadata') or _EMPTY
+                year = metadata.get('year')
                 year_str = f" ({year})" if year and str(year).lower() != 'n/a' else ""
                 
-                rating = r.get('metadata', {}).get('rating') or r.get('metadata', {}).get('imdb_rating')
-                rating_str = f" \033[38;2;218;165;32m★{rating}\033[0m" if rating else ""
+                rating = metadata.get('rating') or metadata.get('imdb_rating')
+                rating_str = f" {_ANSI_GOLD}★{rating}{_ANSI_RESET}" if rating else ""
                 
-                quality = r.get('metadata', {}).get('quality')
+                quality = metadata.get('quality')
                 quality_str = ""
                 if quality:
                     q_upper = quality.upper()
-                    if 'CAM' in q_upper:
-                        q_color = "31"
-                    elif 'BLURAY' in q_upper:
-                        q_color = "36"
-                    elif 'WEB' in q_upper:
-                        q_color = "32"
-                    else:
-                        q_color = "37"
-                    quality_str = f" \033[{q_color}m[{quality}]\033[0m"
+                    q_color = next((color for key, color in _QUALITY_COLORS if key in q_upper), _ANSI_WHITE)
+                    quality_str = f" {q_color}[{quality}]{_ANSI_RESET}"
                 
-                return f"{type_emoji} \033[{type_color}m{r['type'].title().ljust(8)}\033[0m│ {clean_t}{year_str}{rating_str}{quality_str}"
+                return f"{prefix}{clean_t}{year_str}{rating_str}{quality_str}"
             
             results_count = len(results)
             result_header = f"📊 {results_count} {'match' if results_count == 1 else 'matches'}"
@@ -466,17 +592,12 @@ class CinemaCLI:
         
         self.log("🔄", "Loading details...")
         
-        with Progress(
-            SpinnerColumn("arc"),
-            TextColumn("[progress.description]{task.description}"),
-            console=CONSOLE,
-            transient=True
-        ) as progress:
-            task = progress.add_task(f"[{theme['primary']}]Fetching info...", total=None)
+        with self._spinner("arc") as progress:
+            task = progress.add_task(f"[{theme.primary}]Fetching info...", total=None)
             details = await asyncio.to_thread(scraper.get_show_details, show['url'])
         
         if not details:
-            self.log("✗", "Failed to load details", theme['error'])
+            self.log("✗", "Failed to load details", theme.error)
             await asyncio.sleep(2)
             return
         
@@ -492,7 +613,7 @@ class CinemaCLI:
         servers = details.get('servers', [])
         
         if not servers:
-            self.log("⚠️", "No servers found", self.theme['error'])
+            self.log("⚠️", "No servers found", self.theme.error)
             await asyncio.sleep(2)
             return
         
@@ -519,14 +640,8 @@ class CinemaCLI:
     def _clean_episode_title(self, title, num_label):
         if not title:
             return ""
-        t = title.strip()
-        patterns = [
-            rf'^(?:Episode\s+)?0*{re.escape(str(num_label))}\s*[\.\-:]\s*',
-            r'^[\s\.\-:]*\d+\s*[\.\-:]\s*'
-        ]
-        for pat in patterns:
-            t = re.sub(pat, '', t, flags=re.IGNORECASE)
-        return t.strip()
+        t = _num_prefix_re(str(num_label)).sub('', title.strip())
+        return _LEADING_NUM_RE.sub('', t).strip()
     
     def _format_episode_label(self, episode):
         num_raw = episode.get('display_number') or episode.get('episode_number')
@@ -541,7 +656,7 @@ class CinemaCLI:
         self.current_show_title = title
         theme = self.theme
         
-        metadata = details.get('metadata', {}) or {}
+        metadata = details.get('metadata') or _EMPTY
         year = metadata.get('year') or details.get('year')
         rating = metadata.get('rating') or metadata.get('imdb_rating')
         show_type = details.get('type', 'unknown').title()
@@ -550,7 +665,7 @@ class CinemaCLI:
         
         type_emoji = "🎬" if show_type.lower() == 'movie' else "📺" if show_type.lower() == 'series' else "🎌"
         
-        parts = [f"[bold {theme['primary']}]{escape(title)}[/bold {theme['primary']}]"]
+        parts = [f"[bold {theme.primary}]{escape(title)}[/bold {theme.primary}]"]
         
         if year and str(year).lower() not in ('unknown', 'n/a'):
             parts.append(f"📅 {year}")
@@ -567,24 +682,22 @@ class CinemaCLI:
             parts.append(f"📂 {seasons} Seasons")
         
         info = " • ".join(parts)
-        CONSOLE.print(info)
         
         description = (details.get('description') or details.get('story') or "").strip()
+        description_text = Text(description[:200] + "..." if len(description) > 200 else description, style="dim") if description else Text("")
         if description:
-            CONSOLE.print(Text(description[:200] + "..." if len(description) > 200 else description, style="dim"))
-        CONSOLE.print("")
+            CONSOLE.print(info, description_text, "", sep="\n")
+        else:
+            CONSOLE.print(info, "", sep="\n")
         
-        self.current_overview_panel = Group(
-            Text.from_markup(info),
-            Text(description[:200] + "..." if len(description) > 200 else description, style="dim") if description else Text("")
-        )
+        self.current_overview_panel = Group(Text.from_markup(info), description_text)
     
     async def handle_series(self, details):
         seasons = details.get('seasons', [])
         theme = self.theme
         
         if not seasons:
-            self.log("✗", "No seasons found", theme['error'])
+            self.log("✗", "No seasons found", theme.error)
             await asyncio.sleep(2)
             return
         
@@ -631,17 +744,12 @@ class CinemaCLI:
         
         self.log("🔄", "Fetching episodes...")
         
-        with Progress(
-            SpinnerColumn("bouncingBar"),
-            TextColumn("[progress.description]{task.description}"),
-            console=CONSOLE,
-            transient=True
-        ) as progress:
-            task = progress.add_task(f"[{theme['primary']}]Loading episodes...", total=None)
+        with self._spinner("bouncingBar") as progress:
+            task = progress.add_task(f"[{theme.primary}]Loading episodes...", total=None)
             episodes = await asyncio.to_thread(scraper.fetch_season_episodes, selected_season)
         
         if not episodes:
-            self.log("⚠️", f"No episodes found for {season_label}", theme['error'])
+            self.log("⚠️", f"No episodes found for {season_label}", theme.error)
             await asyncio.sleep(2)
             return
         
@@ -650,7 +758,7 @@ class CinemaCLI:
         except Exception:
             pass
         
-        self.log("✓", f"Found {len(episodes)} episodes", f"bold {theme['primary']}")
+        self.log("✓", f"Found {len(episodes)} episodes", f"bold {theme.primary}")
         await asyncio.sleep(0.3)
         
         self.current_episodes = episodes
@@ -659,7 +767,7 @@ class CinemaCLI:
         episode_count = len(episodes)
         while True:
             episode_header = f"📊 {episode_count} episodes"
-            selected_ep = self.run_fzf_objects(
+            selection = self.run_fzf_objects_indexed(
                 episodes,
                 self._format_episode_label,
                 prompt="📺 Episode ❯ ",
@@ -668,10 +776,10 @@ class CinemaCLI:
                 header=episode_header
             )
             
-            if not selected_ep:
+            if selection is None:
                 break
             
-            self.current_episode_index = episodes.index(selected_ep)
+            self.current_episode_index, selected_ep = selection
             
             await self.play_episode(selected_ep, season_label)
     
@@ -692,17 +800,20 @@ class CinemaCLI:
         
         self.log("🔄", "Resolving server...")
         
-        with Progress(
-            SpinnerColumn("star"),
-            TextColumn("[progress.description]{task.description}"),
-            console=CONSOLE,
-            transient=True
-        ) as progress:
-            task = progress.add_task(f"[{theme['primary']}]Getting stream...", total=None)
-            servers = await asyncio.to_thread(scraper.fetch_episode_servers, episode)
+        with self._spinner("star") as progress:
+            task = progress.add_task(f"[{theme.primary}]Getting stream...", total=None)
+            servers = None
+            prefetch, self._prefetch = self._prefetch, None
+            if prefetch and prefetch[0] is episode:
+                try:
+                    servers = await prefetch[1]
+                except Exception:
+                    servers = None
+            if not servers:
+                servers = await asyncio.to_thread(scraper.fetch_episode_servers, episode)
         
         if not servers:
-            self.log("✗", "No servers found", theme['error'])
+            self.log("✗", "No servers found", theme.error)
             await asyncio.sleep(1)
             return
         
@@ -716,7 +827,7 @@ class CinemaCLI:
         theme = self.theme
         
         if not servers:
-            self.log("✗", "No servers available", theme['error'])
+            self.log("✗", "No servers available", theme.error)
             await asyncio.sleep(1)
             return
         
@@ -725,11 +836,13 @@ class CinemaCLI:
         referer = selected_server.get('embed_url') or scraper.base_url
         
         if not video_url:
-            self.log("✗", "Failed to extract video URL", theme['error'])
+            self.log("✗", "Failed to extract video URL", theme.error)
             await asyncio.sleep(1)
             return
         
         self.log("▶️", "Launching player...")
+        if is_episode:
+            self._prefetch_next_episode()
         await asyncio.sleep(0.3)
         
         self.play_video(video_url, referer, title_context)
@@ -737,11 +850,21 @@ class CinemaCLI:
         if is_episode and self.current_episodes:
             await self.prompt_next_episode()
     
+    def _prefetch_next_episode(self):
+        # Resolve the next episode's servers on a worker thread while mpv is playing
+        self._prefetch = None
+        next_index = self.current_episode_index + 1
+        if next_index >= len(self.current_episodes):
+            return
+        next_ep = self.current_episodes[next_index]
+        loop = asyncio.get_running_loop()
+        self._prefetch = (next_ep, loop.run_in_executor(None, scraper.fetch_episode_servers, next_ep))
+    
     async def prompt_next_episode(self):
         theme = self.theme
         
         if self.current_episode_index + 1 >= len(self.current_episodes):
-            self.log("🏁", "Season complete!", f"bold {theme['primary']}")
+            self.log("🏁", "Season complete!", f"bold {theme.primary}")
             await asyncio.sleep(1)
             return
         
@@ -749,7 +872,7 @@ class CinemaCLI:
         next_num = self._normalize_episode_number(next_ep.get('episode_number') or next_ep.get('display_number'))
         
         self.banner()
-        CONSOLE.print(f"[bold {theme['primary']}]⏭️  Next Episode Available[/bold {theme['primary']}]")
+        CONSOLE.print(f"[bold {theme.primary}]⏭️  Next Episode Available[/bold {theme.primary}]")
         CONSOLE.print(f"[dim]Episode {next_num}[/dim]")
         CONSOLE.print("")
         
@@ -769,6 +892,7 @@ class CinemaCLI:
             pass
     
     def play_video(self, url, referer, title=""):
+        self.check_deps()
         theme = self.theme
         ua = scraper.session.headers.get("User-Agent", "Mozilla/5.0")
         
@@ -800,10 +924,10 @@ class CinemaCLI:
         content = f"""
 [bold white]{title}[/bold white]
 
-[{theme['secondary']}]🔄 Buffering video stream...[/{theme['secondary']}]
+[{theme.secondary}]🔄 Buffering video stream...[/{theme.secondary}]
 [dim]Connection established. Waiting for buffer fill...[/dim]
 
-[bold {theme['primary']}]Controls:[/bold {theme['primary']}]
+[bold {theme.primary}]Controls:[/bold {theme.primary}]
 • [bold]q[/bold]     Quit player
 • [bold]Space[/bold] Pause/Resume
 • [bold]f[/bold]     Toggle Fullscreen
@@ -811,8 +935,8 @@ class CinemaCLI:
 """
         CONSOLE.print(Panel(
             content.strip(),
-            title=f"[bold {theme['primary']}]🎬  NOW PLAYING[/bold {theme['primary']}]",
-            border_style=theme['primary'],
+            title=f"[bold {theme.primary}]🎬  NOW PLAYING[/bold {theme.primary}]",
+            border_style=theme.primary,
             padding=(1, 2)
         ))
         
@@ -821,12 +945,12 @@ class CinemaCLI:
             
             CONSOLE.clear()
             if result.returncode == 0:
-                self.log("✓", "Playback finished", f"bold {theme['primary']}")
+                self.log("✓", "Playback finished", f"bold {theme.primary}")
             else:
                 pass
                 
         except Exception as e:
-            self.log("✗", f"Player error: {e}", theme['error'])
+            self.log("✗", f"Player error: {e}", theme.error)
             input("Press Enter to continue...")
 
 
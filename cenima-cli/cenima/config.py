@@ -1,4 +1,7 @@
+from dataclasses import dataclass
 from pathlib import Path
+from types import MappingProxyType
+from typing import Mapping
 
 # --- Version & Metadata ---
 __version__ = "0.1"
@@ -12,27 +15,35 @@ CONFIG_FILE = CONFIG_DIR / "config.json"
 # --- Scraper Configuration ---
 BASE_URL = "https://topcinema.rip"
 
-HEADERS = {
+# Read-only; callers copy before adding per-request headers
+HEADERS = MappingProxyType({
     "User-Agent": "Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/143.0.0.0 Safari/537.36",
     "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
     "Accept-Language": "en-US,en;q=0.9",
     "Referer": BASE_URL,
-}
+})
 
-AJAX_HEADERS = {
+AJAX_HEADERS = MappingProxyType({
     "Accept": "*/*",
     "Accept-Language": "en-US,en;q=0.9",
     "Content-Type": "application/x-www-form-urlencoded; charset=UTF-8",
     "X-Requested-With": "XMLHttpRequest",
     "Origin": BASE_URL,
     "User-Agent": HEADERS["User-Agent"],
-}
+})
 
 REQUEST_TIMEOUT = 15
 RETRY_TOTAL = 3
 RETRY_BACKOFF = 0.5
 RETRY_STATUS_CODES = [429, 500, 502, 503, 504]
 
+# lxml parses several times faster than the pure-Python parser; fall back if missing
+try:
+    import lxml  # noqa: F401
+    HTML_PARSER = "lxml"
+except ImportError:
+    HTML_PARSER = "html.parser"
+
 # --- ASCII Art ---
 ASCII_ART = r"""
 ⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⣀⣀⣀⣀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀⠀
@@ -61,7 +72,15 @@ GOODBYE_ART = r"""
 """
 
 # --- Theme Definitions ---
-THEMES = {
+@dataclass(frozen=True)
+class Theme:
+    __slots__ = ("primary", "secondary", "accent", "error")
+    primary: str
+    secondary: str
+    accent: str
+    error: str
+
+_THEMES_RAW = {
     "blue": {"primary": "#7eb3d4", "secondary": "#9ac9e3", "accent": "#5a9bc7", "error": "#d97979"},
     "red": {"primary": "#d97979", "secondary": "#e59393", "accent": "#c55a5a", "error": "#d97979"},
     "green": {"primary": "#8ba87f", "secondary": "#a3ba98", "accent": "#6d8a62", "error": "#d97979"},
@@ -81,6 +100,9 @@ THEMES = {
     "sunset": {"primary": "#e48b7a", "secondary": "#f0a19a", "accent": "#c66d5c", "error": "#d97979"},
 }
 
+# Frozen so themes can be cached and shared freely
+THEMES: Mapping[str, Theme] = MappingProxyType({name: Theme(**colors) for name, colors in _THEMES_RAW.items()})
+
 DEFAULT_THEME = "cyan"
 
 # --- Spinners ---
@@ -1,98 +1,165 @@
 import re
 import math
+import threading
+import time
+from collections import OrderedDict
+from types import MappingProxyType
+from functools import lru_cache
 from typing import Optional
 from urllib.parse import urlparse, urljoin
-from bs4 import BeautifulSoup
-from curl_cffi import requests
+from html import unescape
+
+from .config import HTML_PARSER, REQUEST_TIMEOUT
+
+_TOKEN_RE = re.compile(r'\b\w+\b', re.ASCII)
+_PACKER_RE = re.compile(rb"return\s+p}\s*\(\s*(['\"])(.*?)\1\s*,\s*(\d+)\s*,\s*(\d+)\s*,\s*(['\"])(.*?)\5\.split\(\s*['\"]\|['\"]\s*\)\s*\)", re.DOTALL)
+# Tail of the packer call, marks the end of the part of the page we need
+_PACKER_END_RE = re.compile(rb"\.split\(\s*['\"]\|['\"]\s*\)\s*\)")
+_FILE_RE = re.compile(r"file\s*:\s*[\"'](https?://[^\"']+\.(?:mp4|m3u8)[^\"']*)[\"']")
+_MP4_GENERIC_RE = re.compile(r"[\"'](https?://[^\"']+\.mp4[^\"']*)[\"']")
+
+# Download link suffix -> rank, best quality first
+_QUALITY_RANKS = {'_x': 0, '_h': 1, '_n': 2, '_l': 3}
+_QUALITY_LABELS = ('1080p', '720p', '480p', '240p')
+
+_QUALITY_HREF_RE = re.compile(r"""(?i:<a\s(?:[^>]*?\s)?href)\s*=\s*["']([^"']*(?:_x|_h|_n|_l))["']""")
+
+def _pick_quality_link(hrefs):
+    # One pass keeping the best-ranked quality link, stop early on 1080p
+    best_rank = len(_QUALITY_LABELS)
+    best = None
+    for href in hrefs:
+        rank = _QUALITY_RANKS.get(href[-2:])
+        if rank is not None and rank < best_rank:
+            best_rank = rank
+            best = href
+            if rank == 0:
+                break
+    if best is None:
+        return None, ""
+    return best, _QUALITY_LABELS[best_rank]
+
+_BASE_HEADERS = MappingProxyType({
+    "User-Agent": "Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
+    "Accept-Language": "en-US,en;q=0.9",
+})
+
+@lru_cache(maxsize=64)
+def _origin_for(referer: str) -> Optional[str]:
+    # The same few referers come back for every episode of a show
+    parsed = urlparse(referer)
+    if parsed.scheme and parsed.netloc:
+        return f"{parsed.scheme}://{parsed.netloc}"
+    return None
+
+@lru_cache(maxsize=64)
+def _headers_for(referer: str):
+    # Built once per referer and shared read-only, instead of a dict copy per request
+    headers = dict(_BASE_HEADERS, Referer=referer)
+    origin = _origin_for(referer)
+    if origin:
+        headers["Origin"] = origin
+    return MappingProxyType(headers)
+
+# Packer digit alphabet, bases above 36 continue with upper case letters
+_BASE62 = "0123456789abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ"
+
+def _base_n_tokens(count, base):
+    if not 2 <= base <= len(_BASE62):
+        raise ValueError(f"unsupported packer radix {base}")
+    # n's token is the token of n // base plus one more digit, so each is built
+    # from an earlier one instead of being converted from scratch
+    tokens = list(_BASE62[:min(count, base)])
+    for n in range(base, count):
+        tokens.append(tokens[n // base] + _BASE62[n % base])
+    return tokens
 
 class VidTubeProcessor:
+    # Shared by processors created without a session, so standalone use keeps one
+    # impersonated session and its open connections for the whole process
+    _shared_session = None
+    _shared_session_lock = threading.Lock()
+
+    # Resolved (url, referer) -> (expires, video_url). Stream links rotate, so
+    # entries only live a few minutes; failures are not cached
+    _resolved = OrderedDict()
+    _resolved_lock = threading.Lock()
+    RESOLVED_TTL = 600
+    RESOLVED_MAX = 256
+
     def __init__(self, session=None):
-        self.session = session or requests.Session(impersonate="chrome120")
-        self.headers = {
-            "User-Agent": "Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
-            "Accept-Language": "en-US,en;q=0.9",
-        }
+        self.session = session or self._get_shared_session()
+        self.headers = _BASE_HEADERS
 
     def _unpack(self, p, a, c, k):
-        def to_base(n, b):
-            if n == 0: return "0"
-            digits = "0123456789abcdefghijklmnopqrstuvwxyz"
-            result = ""
-            while n:
-                result = digits[n % b] + result
-                n //= b
-            return result
-
-        for i in range(c - 1, -1, -1):
-            if i < len(k) and k[i]:
-                token = to_base(i, a)
-                value = k[i]
-                pattern = r'\b' + re.escape(token) + r'\b'
-                p = re.sub(pattern, value, p)
-        return p
-
-    def _handle_vidtube_one(self, html):
-        packer_regex = r"return\s+p}\s*\(\s*(['\"])(.*?)\1\s*,\s*(\d+)\s*,\s*(\d+)\s*,\s*(['\"])(.*?)\5\.split\(\s*['\"]\|['\"]\s*\)\s*\)"
-        match = re.search(packer_regex, html, re.DOTALL)
+        # One scan over the payload with a lookup table instead of a re.sub per keyword
+        table = {token: word for token, word in zip(_base_n_tokens(min(c, len(k)), a), k) if word}
+        return _TOKEN_RE.sub(lambda m: table.get(m.group(0), m.group(0)), p)
+
+    @classmethod
+    def _get_shared_session(cls):
+        with cls._shared_session_lock:
+            if cls._shared_session is None:
+                from curl_cffi import requests
+                cls._shared_session = requests.Session(impersonate="chrome120")
+            return cls._shared_session
+
+    def _read_until_packer(self, resp) -> bytes:
+        # The packed player script is all we need, stop downloading once it has arrived
+        buf = bytearray()
+        for chunk in resp.iter_content():
+            # Overlap the previous chunk so a terminator split across chunks is still seen
+            start = max(len(buf) - 64, 0)
+            buf += chunk
+            if _PACKER_END_RE.search(buf, start):
+                break
+        return bytes(buf)
+
+    def _handle_vidtube_one(self, html: bytes):
+        # Matched on the raw bytes, only the packed script itself gets decoded
+        match = _PACKER_RE.search(html)
         
         if not match:
             return None
             
-        payload = match.group(2)
+        payload = match.group(2).decode("utf-8", "replace")
         radix = int(match.group(3))
         count = int(match.group(4))
-        keywords = match.group(6).split('|')
+        keywords = match.group(6).decode("utf-8", "replace").split('|')
         
         unpacked_code = self._unpack(payload, radix, count, keywords)
         
-        # extract file:"..."
-        m3u8_regex = r"file\s*:\s*[\"'](https?://[^\"']+\.m3u8[^\"']*)[\"']"
-        mp4_regex = r"file\s*:\s*[\"'](https?://[^\"']+\.mp4[^\"']*)[\"']"
-        
-        mp4_match = re.search(mp4_regex, unpacked_code)
-        if mp4_match:
-            return mp4_match.group(1)
-            
-        m3u8_match = re.search(m3u8_regex, unpacked_code)
-        if m3u8_match:
-            return m3u8_match.group(1)
+        # extract file:"...", one pass, first mp4 wins over any m3u8
+        m3u8_url = None
+        for match in _FILE_RE.finditer(unpacked_code):
+            file_url = match.group(1)
+            if '.mp4' in file_url:
+                return file_url
+            if m3u8_url is None:
+                m3u8_url = file_url
             
-        return None
+        return m3u8_url
 
     def _handle_vidtube_pro(self, target_url, html, headers):
-        soup = BeautifulSoup(html, "html.parser")
-        
-        priorities = [
-            ('_x', '1080p'),
-            ('_h', '720p'),
-            ('_n', '480p'),
-            ('_l', '240p')
-        ]
+        # Quality links are matched straight from the raw HTML, the tree is only
+        # built when that finds nothing
+        next_path, quality = _pick_quality_link(
+            unescape(m.group(1)) for m in _QUALITY_HREF_RE.finditer(html)
+        )
         
-        next_path = None
-        quality = ""
-        
-        links = soup.find_all('a', href=True)
-        
-        for suffix, label in priorities:
-            for link in links:
-                href = link['href']
-                if href.endswith(suffix):
-                    next_path = href
-                    quality = label
-                    break
-            if next_path:
-                break
-                
         if not next_path:
-            # Fallback
-            path_only = urlparse(target_url).path
-            for link in links:
-                href = link['href']
-                if '/d/' in href and href != path_only:
-                    next_path = href
-                    quality = "unknown"
-                    break
+            from bs4 import BeautifulSoup
+            links = [link['href'] for link in BeautifulSoup(html, HTML_PARSER).find_all('a', href=True)]
+            next_path, quality = _pick_quality_link(links)
+                
+            if not next_path:
+                # Fallback
+                path_only = urlparse(target_url).path
+                for href in links:
+                    if '/d/' in href and href != path_only:
+                        next_path = href
+                        quality = "unknown"
+                        break
         
         if not next_path:
             return None
@@ -100,46 +167,77 @@ class VidTubeProcessor:
         next_url = urljoin(target_url, next_path)
         
         try:
-            resp = self.session.get(next_url, headers=headers)
+            resp = self.session.get(next_url, headers=headers, timeout=REQUEST_TIMEOUT)
             if resp.status_code != 200:
                 return None
             html2 = resp.text
         except Exception as e:
             return None
         
-        soup2 = BeautifulSoup(html2, "html.parser")
+        from bs4 import BeautifulSoup
+        soup2 = BeautifulSoup(html2, HTML_PARSER)
         
         btn = soup2.select_one('a.btn.btn-gradient.submit-btn')
         if btn and btn.get('href'):
             return btn['href']
         
-        mp4_regex = r"[\"'](https?://[^\"']+\.mp4[^\"']*)[\"']"
-        match = re.search(mp4_regex, html2)
+        match = _MP4_GENERIC_RE.search(html2)
         if match:
             return match.group(1)
             
         return None
 
-    def extract(self, url, referer: Optional[str] = None):
+    def _extract_vidtube_one(self, url, headers):
         try:
-            headers = self.headers.copy()
-            if referer:
-                headers["Referer"] = referer
-                parsed_ref = urlparse(referer)
-                if parsed_ref.scheme and parsed_ref.netloc:
-                    headers["Origin"] = f"{parsed_ref.scheme}://{parsed_ref.netloc}"
-
-            resp = self.session.get(url, headers=headers)
+            resp = self.session.get(url, headers=headers, stream=True, timeout=REQUEST_TIMEOUT)
+        except TypeError:
+            # curl_cffi releases before streaming support reject stream=, read it whole
+            resp = self.session.get(url, headers=headers, timeout=REQUEST_TIMEOUT)
             if resp.status_code != 200:
                 return None
-                
-            html = resp.text
-            parsed = urlparse(url)
-            
-            if 'vidtube.one' in parsed.hostname:
-                return self._handle_vidtube_one(html)
-            else:
-                return self._handle_vidtube_pro(url, html, headers)
-                
+            return self._handle_vidtube_one(resp.content)
+        try:
+            if resp.status_code != 200:
+                return None
+            return self._handle_vidtube_one(self._read_until_packer(resp))
+        finally:
+            resp.close()
+
+    def _extract_vidtube_pro(self, url, headers):
+        resp = self.session.get(url, headers=headers, timeout=REQUEST_TIMEOUT)
+        if resp.status_code != 200:
+            return None
+        return self._handle_vidtube_pro(url, resp.text, headers)
+
+    def extract(self, url, referer: Optional[str] = None):
+        key = (url, referer)
+        with self._resolved_lock:
+            entry = self._resolved.get(key)
+            if entry and entry[0] > time.monotonic():
+                self._resolved.move_to_end(key)
+                return entry[1]
+
+        try:
+            headers = _headers_for(referer) if referer else self.headers
+            handler = _handler_for(urlparse(url).hostname)
+            video_url = handler(self, url, headers)
         except Exception as e:
             return None
+
+        if video_url:
+            with self._resolved_lock:
+                self._resolved[key] = (time.monotonic() + self.RESOLVED_TTL, video_url)
+                self._resolved.move_to_end(key)
+                while len(self._resolved) > self.RESOLVED_MAX:
+                    self._resolved.popitem(last=False)
+        return video_url
+
+# Host -> extract method, matched on the host or any subdomain of it; anything
+# else goes through the download page flow
+_HOST_HANDLERS = (('vidtube.one', VidTubeProcessor._extract_vidtube_one),)
+
+@lru_cache(maxsize=64)
+def _handler_for(hostname: str):
+    return next((fn for host, fn in _HOST_HANDLERS
+                 if hostname == host or hostname.endswith('.' + host)),
+                VidTubeProcessor._extract_vidtube_pro)
@@ -1,30 +1,98 @@
 #!/usr/bin/env python3
 import re
+import sys
 import json
+import hashlib
 import os
+import time
+import threading
+import unicodedata
+from functools import lru_cache
 from curl_cffi import requests
 from typing import List, Dict, Optional, Any
-from urllib.parse import quote, urlparse, unquote, urlsplit, urlunsplit
-from bs4 import BeautifulSoup
+from html import unescape
+from urllib.parse import quote, urlencode, urlparse, unquote, urlsplit, urlunsplit, urljoin
+from bs4 import BeautifulSoup, SoupStrainer
+import soupsieve
 
 from .config import (
     BASE_URL, HEADERS, AJAX_HEADERS,
-    REQUEST_TIMEOUT, RETRY_TOTAL, RETRY_BACKOFF, RETRY_STATUS_CODES
+    REQUEST_TIMEOUT, RETRY_TOTAL, RETRY_BACKOFF, RETRY_STATUS_CODES,
+    HTML_PARSER, CONFIG_DIR
 )
 
+# Selectors run once per search result; compile them once
+_SEL_TITLE = soupsieve.compile(".title")
+_SEL_TITLE_ALT = soupsieve.compile(".Title")
+_SEL_RIBBON = soupsieve.compile(".ribbon")
+_SEL_LIST_ITEMS = soupsieve.compile("ul.liList li")
+_SEL_STAR = soupsieve.compile(".fa-star")
+
+# Patterns used on every parsed item, compiled once
+_ARABIC_RUN_RE = re.compile(r'[\u0600-\u06FF]+')
+_NUMBER_RE = re.compile(r'(\d+(?:\.\d+)?)')
+_DIGITS_RE = re.compile(r'\d+')
+_YEAR_RE = re.compile(r'(\d{4})')
+_FINAL_PART_RE = re.compile(r'(?:part|الجزء|جزء)[- ]?(\d+)')
+_SEASON_RE = re.compile(r'(?:الموسم|season)[- ]?(\d+)|(?:^|/)s(\d+)(?:$|/)')
+_PART_RE = re.compile(r'(?:part|الجزء|جزء)[- ]?(\d+)|p(\d+)', re.IGNORECASE)
+_EP_NUM_RE = re.compile(r'(?:الحلقة|episode|ep)[- ]?(\d+(?:\.\d+)?)', re.IGNORECASE)
+_SPECIAL_RE = re.compile(r'(?:ova|special|movie|خاص)', re.IGNORECASE)
+_PART_STRIP_RE = re.compile(r'(?:part|season|الجزء|الموسم)[- ]?\d+', re.IGNORECASE)
+_WATCH_QUALITY_RE = re.compile(r'بجودة\s+([A-Za-z0-9\-]+)')
+_DESC_QUALITY_RE = re.compile(r'(?:بجودة|quality)\s+([A-Za-z0-9\-\.]+)', re.IGNORECASE)
+_SCRIPT_ID_RE = re.compile(r'id["\']?\s*[:=]\s*["\']?(\d+)|p=(\d+)')
+_SHORTLINK_ID_RE = re.compile(r'p=(\d+)')
+
+@lru_cache(maxsize=512)
+def _ep_number_re(ep_num: str):
+    # Episode numbers repeat across shows, compile each word-bounded pattern once
+    return re.compile(r'\b' + re.escape(ep_num) + r'\b')
+
+# BeautifulSoup attribute/string matchers
+_YEAR_CLASS_RE = re.compile("year")
+_TITLE_CLASS_RE = re.compile("title")
+_POSTER_CLASS_RE = re.compile("poster")
+_SYNOPSIS_CLASS_RE = re.compile("synopsis|description|story")
+_IMDB_TEXT_RE = re.compile("IMDb", re.IGNORECASE)
+_YEAR_TEXT_RE = re.compile("سنة|year", re.IGNORECASE)
+_GENRE_HREF_RE = re.compile("genre")
+_TRAILER_CLASS_RE = re.compile("trailer")
+# WordPress "post-1234" class; bs4 tries it per class token, the group is the id
+_POST_CLASS_RE = re.compile(r"^post-(\d+)(?:-|$)")
+_METADATA_TAGS = frozenset(("a", "h1", "h2", "img", "div", "ul", "meta"))
+
+_QUALITY_TOKENS = ('1080P', '720P', '480P', 'BLURAY', 'WEB-DL', 'WEBRIP', 'HDCAM')
+
+
+# Search responses only need the result boxes, skip building the rest of the tree
+_RESULT_STRAINER = SoupStrainer(class_="Small--Box")
+
+
+def make_soup(markup, parse_only: Optional[SoupStrainer] = None) -> BeautifulSoup:
+    return BeautifulSoup(markup, HTML_PARSER, parse_only=parse_only)
 
 def clean_text(text: str) -> str:
     if not text:
         return ""
-    return " ".join(text.strip().split())
+    text = text.strip()
+    # Every whitespace char other than ' ' is non-printable, so this catches
+    # already-clean text without building the split list
+    if "  " not in text and text.isprintable():
+        return text
+    return " ".join(text.split())
 
 def clean_arabic_title(text: str) -> str:
     if not text:
         return text
     
-    text = re.sub(r'[\u0600-\u06FF]+', '', text)
+    # isascii() is a flag check on the string, English-only titles skip the regex
+    if not text.isascii():
+        text = _ARABIC_RUN_RE.sub('', text)
     
     parts = text.split()
+    if len(parts) < 2:
+        return parts[0] if parts else ""
     seen_numbers = set()
     cleaned_parts = []
     for part in parts:
@@ -35,11 +103,11 @@ def clean_arabic_title(text: str) -> str:
         else:
             cleaned_parts.append(part)
     
-    text = ' '.join(cleaned_parts)
-    
-    text = re.sub(r'\s+', ' ', text)
-    return text.strip()
+    # split() already dropped every whitespace run, the join needs no cleanup
+    return ' '.join(cleaned_parts)
 
+# Episode numbers repeat across seasons and shows, so each distinct string is parsed once
+@lru_cache(maxsize=4096)
 def parse_episode_number(ep_str: str) -> float:
     if not ep_str:
         return 99999.0
@@ -49,7 +117,7 @@ def parse_episode_number(ep_str: str) -> float:
     if ep_str.lower() == "special" or ep_str == "0":
         return 0.0
     
-    match = re.search(r'(\d+(?:\.\d+)?)', ep_str)
+    match = _NUMBER_RE.search(ep_str)
     if match:
         try:
             return float(match.group(1))
@@ -58,53 +126,72 @@ def parse_episode_number(ep_str: str) -> float:
     
     return 99999.0
 
+# Hamza/madda alef forms and alef maqsura spelled as yeh, so "الأول"/"الاول" and
+# "الثانى"/"الثاني" compare equal
+_ARABIC_FOLD = str.maketrans({'\u0623': '\u0627', '\u0625': '\u0627', '\u0622': '\u0627',
+                              '\u0671': '\u0627', '\u0649': '\u064a'})
+
+def _normalize_arabic(text: str) -> str:
+    if text.isascii():
+        return text
+    # The quick check answers for almost every string without building a copy
+    if not unicodedata.is_normalized("NFC", text):
+        text = unicodedata.normalize("NFC", text)
+    return text.translate(_ARABIC_FOLD)
+
+# Arabic ordinals mapping (order matters - check longer phrases first!)
+_ARABIC_ORDINALS = {
+    # Teens (11-19) - must come before basic numbers
+    'الحادي عشر': 11, 'حادي عشر': 11,
+    'الثاني عشر': 12, 'ثاني عشر': 12,
+    'الثالث عشر': 13, 'ثالث عشر': 13,
+    'الرابع عشر': 14, 'رابع عشر': 14,
+    'الخامس عشر': 15, 'خامس عشر': 15,
+    'السادس عشر': 16, 'سادس عشر': 16,
+    'السابع عشر': 17, 'سابع عشر': 17,
+    'الثامن عشر': 18, 'ثامن عشر': 18,
+    'التاسع عشر': 19, 'تاسع عشر': 19,
+    'الحادي والعشرون': 21, 'حادي والعشرون': 21,
+    'الثاني والعشرون': 22, 'ثاني والعشرون': 22,
+    'العشرون': 20, 'عشرون': 20,
+    'العاشر': 10, 'عاشر': 10,
+    'التاسع': 9, 'تاسع': 9,
+    'الثامن': 8, 'ثامن': 8,
+    'السابع': 7, 'سابع': 7,
+    'السادس': 6, 'سادس': 6,
+    'الخامس': 5, 'خامس': 5,
+    'الرابع': 4, 'رابع': 4,
+    'الثالث': 3, 'ثالث': 3,
+    'الثاني': 2, 'ثاني': 2,
+    'الاول': 1, 'الأول': 1, 'اول': 1,
+}
+
+# Longest first, sorted once instead of on every call
+_ORDINALS_BY_LENGTH = tuple(sorted(
+    {_normalize_arabic(k): v for k, v in _ARABIC_ORDINALS.items()}.items(),
+    key=lambda kv: len(kv[0]), reverse=True
+))
+
 def extract_season_number(text: str) -> int:
     from urllib.parse import unquote
     
     # URL decode first (handles %d9%85 etc.)
-    text = unquote(text)
+    text = _normalize_arabic(unquote(text))
     text_lower = text.lower()
     
     text_normalized = text_lower.replace('-', ' ').replace('_', ' ')
     
-    if 'final' in text_normalized or 'نهائي' in text_normalized or 'الأخير' in text_normalized:
-        part_match = re.search(r'(?:part|الجزء|جزء)[- ]?(\d+)', text_normalized)
+    if 'final' in text_normalized or 'نهائي' in text_normalized or 'الاخير' in text_normalized:
+        part_match = _FINAL_PART_RE.search(text_normalized)
         if part_match:
             return 100 + int(part_match.group(1))
         return 100
     
-    # Arabic ordinals mapping (order matters - check longer phrases first!)
-    arabic_ordinals = {
-        # Teens (11-19) - must come before basic numbers
-        'الحادي عشر': 11, 'حادي عشر': 11,
-        'الثاني عشر': 12, 'ثاني عشر': 12,
-        'الثالث عشر': 13, 'ثالث عشر': 13,
-        'الرابع عشر': 14, 'رابع عشر': 14,
-        'الخامس عشر': 15, 'خامس عشر': 15,
-        'السادس عشر': 16, 'سادس عشر': 16,
-        'السابع عشر': 17, 'سابع عشر': 17,
-        'الثامن عشر': 18, 'ثامن عشر': 18,
-        'التاسع عشر': 19, 'تاسع عشر': 19,
-        'الحادي والعشرون': 21, 'حادي والعشرون': 21,
-        'الثاني والعشرون': 22, 'ثاني والعشرون': 22,
-        'العشرون': 20, 'عشرون': 20,
-        'العاشر': 10, 'عاشر': 10,
-        'التاسع': 9, 'تاسع': 9,
-        'الثامن': 8, 'ثامن': 8,
-        'السابع': 7, 'سابع': 7,
-        'السادس': 6, 'سادس': 6,
-        'الخامس': 5, 'خامس': 5,
-        'الرابع': 4, 'رابع': 4,
-        'الثالث': 3, 'ثالث': 3,
-        'الثاني': 2, 'ثاني': 2,
-        'الاول': 1, 'الأول': 1, 'اول': 1,
-    }
-    
-    for ordinal in sorted(arabic_ordinals.keys(), key=len, reverse=True):
+    for ordinal, number in _ORDINALS_BY_LENGTH:
         if ordinal in text_normalized:
-            return arabic_ordinals[ordinal]
+            return number
     
-    match = re.search(r'(?:الموسم|season)[- ]?(\d+)|(?:^|/)s(\d+)(?:$|/)', text_normalized)
+    match = _SEASON_RE.search(text_normalized)
     if match:
         for group in match.groups():
             if group:
@@ -114,9 +201,9 @@ def extract_season_number(text: str) -> int:
 
 def extract_season_part(text: str) -> Optional[str]:
     from urllib.parse import unquote
-    text = unquote(text).lower()
+    text = _normalize_arabic(unquote(text)).lower()
     
-    part_match = re.search(r'(?:part|الجزء|جزء)[- ]?(\d+)|p(\d+)', text, re.IGNORECASE)
+    part_match = _PART_RE.search(text)
     if part_match:
         part_num = part_match.group(1) or part_match.group(2)
         return f"Part {part_num}"
@@ -128,10 +215,167 @@ def extract_season_part(text: str) -> Optional[str]:
     
     return None
 
+# One impersonated session for every scraper in the process, so new instances
+# reuse its open connections instead of redoing the TLS handshake
+_shared_session = None
+_shared_lock = threading.Lock()
+
+COOKIE_REFRESH_INTERVAL = 60
+_refresh_lock = threading.Lock()
+_cookies_refreshed_at = float("-inf")
+
+DOMAIN_CACHE_FILE = CONFIG_DIR / "domain_cache.json"
+DOMAIN_CACHE_DURATION = 6 * 3600
+_discovered_domain = None
+
+
+def _get_shared_session():
+    global _shared_session
+    with _shared_lock:
+        if _shared_session is None:
+            _shared_session = requests.Session(impersonate="chrome120")
+            _shared_session.headers.update(HEADERS)
+        return _shared_session
+
+
+def _read_domain_cache() -> Optional[str]:
+    try:
+        data = json.loads(DOMAIN_CACHE_FILE.read_text())
+        if time.time() - data.get('timestamp', 0) < DOMAIN_CACHE_DURATION:
+            return data.get('domain') or None
+    except Exception:
+        pass
+    return None
+
+
+def _write_domain_cache(domain: str):
+    try:
+        CONFIG_DIR.mkdir(parents=True, exist_ok=True)
+        tmp = DOMAIN_CACHE_FILE.with_name(f".{DOMAIN_CACHE_FILE.name}.{os.getpid()}.tmp")
+        tmp.write_text(json.dumps({'domain': domain, 'timestamp': time.time()}))
+        os.replace(tmp, DOMAIN_CACHE_FILE)
+    except Exception:
+        pass
+
+
+# Parsed seasons on disk. Entries are served for SEASON_CACHE_DURATION, after that
+# only if the page's ETag/Last-Modified still matches what was stored.
+# One JSON file per season, replaced atomically, so the CLI and several API
+# workers can share the directory; file mtimes double as the age index for pruning
+SEASON_CACHE_DIR = CONFIG_DIR / "seasons"
+SEASON_CACHE_DURATION = 1800
+SEASON_CACHE_MAX_ENTRIES = 256
+
+
+def _season_cache_path(season_url: str):
+    return SEASON_CACHE_DIR / (hashlib.sha1(season_url.encode("utf-8")).hexdigest() + ".json")
+
+
+def _season_cache_get(season_url: str) -> Optional[Dict]:
+    try:
+        return json.loads(_season_cache_path(season_url).read_text(encoding="utf-8"))
+    except Exception:
+        return None
+
+
+def _season_cache_put(season_url: str, entry: Dict):
+    try:
+        SEASON_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        path = _season_cache_path(season_url)
+        tmp = path.with_name(f".{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+        tmp.write_text(json.dumps(entry, ensure_ascii=False), encoding="utf-8")
+        os.replace(tmp, path)
+        _prune_season_cache()
+    except Exception:
+        pass
+
+
+def _prune_season_cache():
+    entries = []
+    with os.scandir(SEASON_CACHE_DIR) as it:
+        for f in it:
+            if f.name.endswith(".json"):
+                try:
+                    entries.append((f.stat().st_mtime, f.path))
+                except OSError:
+                    pass
+    if len(entries) <= SEASON_CACHE_MAX_ENTRIES:
+        return
+    # Drop the older half rather than pruning on every write
+    entries.sort()
+    for _, path in entries[:len(entries) // 2]:
+        try:
+            os.remove(path)
+        except OSError:
+            pass
+
+
+def _page_validator(headers) -> Optional[str]:
+    return headers.get("ETag") or headers.get("Last-Modified")
+
+
+def _servers_list_id(html: str):
+    # The server list usually carries the id; parse just that <ul> when it can be
+    # cut out cleanly and leave the full-page scan for everything else.
+    # Returns (id, parsed list) or (None, None)
+    marker = html.find("servers-list")
+    if marker < 0:
+        return None, None
+    start = html.rfind("<", 0, marker)
+    end = html.find("</ul>", marker)
+    if start < 0 or end < 0:
+        return None, None
+    window = make_soup(html[start:end + 5])
+    for li in window.select("ul.servers-list li"):
+        if li.get("data-id"):
+            return li.get("data-id"), window
+    return None, None
+
+
+def _server_slot_order(soup: BeautifulSoup) -> Optional[List[int]]:
+    # Slot indices listed on the page, VidTube-labelled ones first. Only trusted
+    # when every entry names its index, otherwise the caller probes 0..N
+    slots = []
+    for li in soup.select("ul.servers-list li"):
+        index = li.get("data-server")
+        if not index or not index.isdigit():
+            return None
+        slots.append((int(index), "vidtube" not in li.get_text().lower()))
+    if not slots:
+        return None
+    return [index for index, _ in sorted(set(slots), key=lambda slot: (slot[1], slot[0]))]
+
+
+_PLAIN_URL_RE = re.compile(r'https?://[A-Za-z0-9.-]+(?::\d+)?[A-Za-z0-9_.~/-]*')
+_PAGE_PARAM_RE = re.compile(r'[?&]page=(\d+)')
+# Case-insensitive so embed URLs are checked without lowercasing a copy first
+_VIDTUBE_RE = re.compile(r'vidtube\.(?:one|pro|me|to)', re.IGNORECASE)
+_VIDTUBE_ANY_RE = re.compile(r'vidtube', re.IGNORECASE)
+# The server AJAX reply is a lone iframe, read its src without building a tree
+_IFRAME_SRC_RE = re.compile(r'<iframe\s(?:[^>]*?\s)?src\s*=\s*["\']([^"\']+)["\']', re.IGNORECASE)
+_PAGE_FETCH_WORKERS = 6
+_SERVER_PROBE_WORKERS = 4
+_CONTENT_ID_CACHE_MAX = 1024
+
+
+def _last_page_number(soup: BeautifulSoup) -> int:
+    # Highest page number in the pagination bar, 1 when the page has none
+    last = 1
+    for link in soup.select("a.page-numbers"):
+        match = _PAGE_PARAM_RE.search(link.get("href", ""))
+        if match:
+            last = max(last, int(match.group(1)))
+        else:
+            text = link.get_text(strip=True)
+            if text.isdigit():
+                last = max(last, int(text))
+    return last
+
+
 class TopCinemaScraper:
     
     def __init__(self, base_url: Optional[str] = None):
-        self.session = requests.Session(impersonate="chrome120")
+        self.session = _get_shared_session()
 
         if base_url:
             self.base_url = base_url.rstrip('/')
@@ -141,24 +385,36 @@ class TopCinemaScraper:
             if discovered:
                 self.base_url = discovered
 
-        self.session.headers.update(HEADERS)
-    
-    def _discover_domain(self) -> str:
-        try:
-            response = self.session.get(BASE_URL, timeout=10)
-            final_url = response.url.rstrip('/')
-            return final_url
-        except Exception:
-            return BASE_URL.rstrip('/')
-    
-    def _get_endpoint(self, endpoint_type: str) -> str:
-        base = self.base_url.rstrip('/')
-        endpoints = {
+        self._base_url_slash = self.base_url + '/'
+        self._content_ids = {}
+        base = self.base_url
+        self._endpoints = {
             "search": f"{base}/wp-content/themes/movies2023/Ajaxat/Searching.php",
             "server": f"{base}/wp-content/themes/movies2023/Ajaxat/Single/Server.php",
             "trailer": f"{base}/wp-content/themes/movies2023/Ajaxat/Home/LoadTrailer.php"
         }
-        return endpoints.get(endpoint_type, "")
+    
+    def _discover_domain(self) -> str:
+        # The redirect target only changes when the site moves, so remember it in
+        # memory and on disk instead of probing on every start
+        global _discovered_domain
+        with _shared_lock:
+            if _discovered_domain:
+                return _discovered_domain
+        domain = _read_domain_cache()
+        if not domain:
+            try:
+                response = self.session.get(BASE_URL, timeout=10)
+                domain = response.url.rstrip('/')
+                _write_domain_cache(domain)
+            except Exception:
+                return BASE_URL.rstrip('/')
+        with _shared_lock:
+            _discovered_domain = domain
+        return domain
+    
+    def _get_endpoint(self, endpoint_type: str) -> str:
+        return self._endpoints.get(endpoint_type, "")
     
     def search(self, query: str, content_type: Optional[str] = None) -> List[Dict]:
         try:
@@ -168,7 +424,7 @@ class TopCinemaScraper:
             ajax_headers["Origin"] = self.base_url
             
             response = self.session.post(
-                self._get_endpoint("search"),
+                self._endpoints["search"],
                 data=data,
                 headers=ajax_headers,
                 timeout=REQUEST_TIMEOUT,
@@ -176,7 +432,7 @@ class TopCinemaScraper:
             )
             response.raise_for_status()
             
-            soup = BeautifulSoup(response.text, "html.parser")
+            soup = make_soup(response.text, _RESULT_STRAINER)
             results = []
             
             for item in soup.select(".Small--Box"):
@@ -192,6 +448,18 @@ class TopCinemaScraper:
             print(f"[ERROR] Search failed: {e}")
             return []
     
+    def _classify_type(self, url_lc: str, title: str) -> str:
+        # Robust Type Detection based on URL slug and Title
+        # Note: Anime URLs often live under /series/, so check for 'anime'/'انمي' specifically
+        title_lc = title.lower()
+        if ("انمي" in url_lc or "/anime/" in url_lc or 
+            "انمي" in title or "anime" in title_lc):
+            return "anime"
+        if ("مسلسل" in url_lc or "/series/" in url_lc or 
+            "مسلسل" in title or "series" in title_lc):
+            return "series"
+        return "movie"
+
     def _parse_search_result(self, item) -> Optional[Dict]:
         try:
             link = item.find("a")
@@ -200,43 +468,31 @@ class TopCinemaScraper:
             
             url = link["href"]
             
-            title_elem = item.select_one(".title") or item.select_one(".Title") or item.find("h3")
+            title_elem = _SEL_TITLE.select_one(item) or _SEL_TITLE_ALT.select_one(item) or item.find("h3")
             title = clean_text(title_elem.get_text()) if title_elem else clean_text(link.get("title", "Unknown"))
             
-            decoded_url = unquote(url).lower()
-            show_type = "movie"
-            
-            # Robust Type Detection based on URL slug and Title
-            # Note: Anime URLs often live under /series/, so check for 'anime'/'انمي' specifically
-            if ("انمي" in decoded_url or "/anime/" in decoded_url or 
-                "انمي" in title or "anime" in title.lower()):
-                show_type = "anime"
-            elif ("مسلسل" in decoded_url or "/series/" in decoded_url or 
-                  "مسلسل" in title or "series" in title.lower()):
-                show_type = "series"
-            elif ("فيلم" in decoded_url or "/movie/" in decoded_url or 
-                  "فيلم" in title or "movie" in title.lower()):
-                show_type = "movie"
+            show_type = self._classify_type(unquote(url).lower(), title)
             
             metadata = {}
             
             quality_candidates = []
             
-            ribbon = item.select_one(".ribbon")
+            ribbon = _SEL_RIBBON.select_one(item)
             if ribbon:
                 quality_candidates.append(clean_text(ribbon.get_text()))
             
             # 2. List items - second item is often quality, but let's scan all
-            list_items = item.select("ul.liList li")
+            list_items = _SEL_LIST_ITEMS.select(item)
             for li in list_items:
                 text = clean_text(li.get_text())
                 # Check if it looks like quality (contains 1080p, 720p, BluRay, WEB-DL, etc)
-                if any(q in text.upper() for q in ['1080P', '720P', '480P', 'BLURAY', 'WEB-DL', 'WEBRIP', 'HDCAM']):
+                text_upper = text.upper()
+                if any(q in text_upper for q in _QUALITY_TOKENS):
                      quality_candidates.append(text)
                 
                 # Check for rating (contains star icon or numbers)
-                if li.select_one(".fa-star") or "imdb" in li.get("class", []):
-                    match = re.search(r'(\d+(?:\.\d+)?)', text)
+                if _SEL_STAR.select_one(li) or "imdb" in li.get("class", []):
+                    match = _NUMBER_RE.search(text)
                     if match:
                         metadata["rating"] = float(match.group(1))
             
@@ -245,10 +501,10 @@ class TopCinemaScraper:
                 metadata["quality"] = max(quality_candidates, key=len)
             
             # Year
-            year_elem = item.find("span", class_=re.compile("year"))
+            year_elem = item.find("span", class_=_YEAR_CLASS_RE)
             if year_elem:
                 year_text = clean_text(year_elem.get_text())
-                match = re.search(r'(\d{4})', year_text)
+                match = _YEAR_RE.search(year_text)
                 if match:
                     metadata["year"] = int(match.group(1))
             
@@ -294,7 +550,7 @@ class TopCinemaScraper:
             response = self.session.get(url, timeout=REQUEST_TIMEOUT)
             response.raise_for_status()
             
-            soup = BeautifulSoup(response.text, "html.parser")
+            soup = make_soup(response.text)
             
             details = self._parse_metadata(soup, url)
             details["type"] = "movie"
@@ -308,7 +564,7 @@ class TopCinemaScraper:
                 try:
                     w_resp = self.session.get(watch_url, timeout=REQUEST_TIMEOUT)
                     if w_resp.status_code == 200:
-                        w_soup = BeautifulSoup(w_resp.text, "html.parser")
+                        w_soup = make_soup(w_resp.text)
                         movie_id = self._extract_content_id(watch_url, w_soup)
                         
                         if not details.get("quality"):
@@ -316,14 +572,14 @@ class TopCinemaScraper:
                              if desc:
                                  content = desc.get("content", "")
                                  if "بجودة" in content:
-                                     match = re.search(r'بجودة\s+([A-Za-z0-9\-]+)', content)
+                                     match = _WATCH_QUALITY_RE.search(content)
                                      if match:
                                          details["metadata"]["quality"] = match.group(1)
                 except Exception as e:
                     pass
             
             if movie_id:
-                details["servers"] = self.get_servers(movie_id, watch_url)
+                details["servers"] = self.get_servers(movie_id, watch_url, order=self._server_order(url, watch_url))
             
             return details
         
@@ -336,7 +592,7 @@ class TopCinemaScraper:
             response = self.session.get(url, timeout=REQUEST_TIMEOUT)
             response.raise_for_status()
             
-            soup = BeautifulSoup(response.text, "html.parser")
+            soup = make_soup(response.text)
             
             details = self._parse_metadata(soup, url)
             details["type"] = show_type
@@ -406,47 +662,93 @@ class TopCinemaScraper:
             traceback.print_exc()
             return None
     
+    def _scan_metadata_nodes(self, soup: BeautifulSoup):
+        # One walk over the page instead of a find() per field; like find(), the
+        # first match in document order wins
+        found = {}
+        genre_links = []
+        for node in soup.descendants:
+            name = node.name
+            if name is None:
+                if "imdb_text" not in found and _IMDB_TEXT_RE.search(node):
+                    found["imdb_text"] = node
+                if "year_text" not in found and _YEAR_TEXT_RE.search(node):
+                    found["year_text"] = node
+                continue
+            if name not in _METADATA_TAGS:
+                continue
+            classes = node.get("class") or ()
+            class_str = " ".join(classes)
+            if name == "a":
+                href = node.get("href")
+                if href is not None and _GENRE_HREF_RE.search(href):
+                    genre_links.append(node)
+                if "trailer" not in found and _TRAILER_CLASS_RE.search(class_str):
+                    found["trailer"] = node
+            elif name == "h1":
+                found.setdefault("h1", node)
+                if "h1_title" not in found and "post-title" in classes:
+                    found["h1_title"] = node
+            elif name == "h2":
+                if "h2_title" not in found and _TITLE_CLASS_RE.search(class_str):
+                    found["h2_title"] = node
+            elif name == "img":
+                if "poster" not in found and _POSTER_CLASS_RE.search(class_str):
+                    found["poster"] = node
+            elif name == "div":
+                if "synopsis" not in found and _SYNOPSIS_CLASS_RE.search(class_str):
+                    found["synopsis"] = node
+            elif name == "ul":
+                if "tax" not in found and "RightTaxContent" in classes:
+                    found["tax"] = node
+            elif name == "meta":
+                if "description" not in found and node.get("name") == "description":
+                    found["description"] = node
+                if "og_description" not in found and node.get("property") == "og:description":
+                    found["og_description"] = node
+        return found, genre_links
+    
     def _parse_metadata(self, soup: BeautifulSoup, url: str) -> Dict:
         metadata = {"url": url}
         
-        title_elem = soup.find("h1", class_="post-title") or \
-                     soup.find("h1") or \
-                     soup.find("h2", class_=re.compile("title"))
+        found, genre_links = self._scan_metadata_nodes(soup)
+        
+        title_elem = found.get("h1_title") or found.get("h1") or found.get("h2_title")
                      
         if title_elem:
             metadata["title"] = clean_text(title_elem.get_text())
         else:
             metadata["title"] = "Unknown Title"
         
-        poster = soup.find("img", class_=re.compile("poster"))
+        poster = found.get("poster")
         if poster:
             poster_url = poster.get("data-src") or poster.get("src")
             if poster_url:
                 metadata["poster"] = poster_url
         
-        synopsis_elem = soup.find("div", class_=re.compile("synopsis|description|story"))
+        synopsis_elem = found.get("synopsis")
         if synopsis_elem:
             metadata["synopsis"] = clean_text(synopsis_elem.get_text())
         
-        rating_elem = soup.find(string=re.compile("IMDb", re.IGNORECASE))
+        rating_elem = found.get("imdb_text")
         if rating_elem:
             parent = rating_elem.find_parent()
             if parent:
                 rating_text = clean_text(parent.get_text())
-                match = re.search(r'(\d+(?:\.\d+)?)', rating_text)
+                match = _NUMBER_RE.search(rating_text)
                 if match:
                     metadata["imdb_rating"] = float(match.group(1))
         
-        year_elem = soup.find(string=re.compile("سنة|year", re.IGNORECASE))
+        year_elem = found.get("year_text")
         if year_elem:
             parent = year_elem.find_parent()
             if parent:
                 year_text = clean_text(parent.get_text())
-                match = re.search(r'(\d{4})', year_text)
+                match = _YEAR_RE.search(year_text)
                 if match:
                     metadata["year"] = int(match.group(1))
         
-        tax = soup.find('ul', class_='RightTaxContent')
+        tax = found.get("tax")
         if tax:
             key_mapping = {
                 "قسم المسلسل": "category", "قسم الفيلم": "category", "نوع المسلسل": "genres",
@@ -479,20 +781,19 @@ class TopCinemaScraper:
                             metadata[key] = val_text
                         
                         if key == "release_year" and "year" not in metadata:
-                             match = re.search(r'(\d{4})', val_text)
+                             match = _YEAR_RE.search(val_text)
                              if match: metadata["year"] = int(match.group(1))
 
         if "quality" not in metadata:
-             desc_elem = soup.find("meta", {"name": "description"}) or soup.find("meta", property="og:description")
+             desc_elem = found.get("description") or found.get("og_description")
              if desc_elem:
                  content = desc_elem.get("content", "")
-                 match = re.search(r'(?:بجودة|quality)\s+([A-Za-z0-9\-\.]+)', content, re.IGNORECASE)
+                 match = _DESC_QUALITY_RE.search(content)
                  if match:
                      metadata["quality"] = match.group(1)
 
         if "genres" not in metadata:
             genres = []
-            genre_links = soup.find_all("a", href=re.compile("genre"))
             for link in genre_links:
                 genre = clean_text(link.get_text())
                 if genre:
@@ -500,7 +801,7 @@ class TopCinemaScraper:
             if genres:
                 metadata["genres"] = genres
         
-        trailer_button = soup.find("a", class_=re.compile("trailer"))
+        trailer_button = found.get("trailer")
         if trailer_button and trailer_button.get("data-url"):
             trailer_url = self._get_trailer_url(url, trailer_button["data-url"])
             if trailer_url:
@@ -512,6 +813,20 @@ class TopCinemaScraper:
         try:
             season_num = extract_season_number(season_url)
             
+            cached = _season_cache_get(season_url)
+            if cached:
+                if time.time() - cached["timestamp"] < SEASON_CACHE_DURATION:
+                    return cached["result"]
+                if cached.get("validator"):
+                    try:
+                        head = self.session.head(cached["page_url"], timeout=REQUEST_TIMEOUT)
+                        if head.status_code == 200 and _page_validator(head.headers) == cached["validator"]:
+                            cached["timestamp"] = time.time()
+                            _season_cache_put(season_url, cached)
+                            return cached["result"]
+                    except Exception:
+                        pass
+            
             # Prepare list URL (use /list/ endpoint)
             base_url = season_url.rstrip('/')
             
@@ -546,119 +861,156 @@ class TopCinemaScraper:
             
             # If first try fails (404), fallback to base_url without /list
             fallback_mode = False
+            first_soup = None
+            first_page = None
 
-            while page <= max_pages:
-                # Build page URL
-                if page == 1:
-                    current_url = first_try_url if not fallback_mode else base_url
-                else:
-                    if fallback_mode:
-                        current_url = f"{base_url}/?page={page}"
-                    else:
-                        current_url = f"{first_try_url}/?page={page}"
-                
-                try:
-                    response = self.session.get(current_url, timeout=REQUEST_TIMEOUT)
+            def page_url(n: int) -> str:
+                if n == 1:
+                    return first_try_url if not fallback_mode else base_url
+                if fallback_mode:
+                    return f"{base_url}/?page={n}"
+                return f"{first_try_url}/?page={n}"
+            
+            # Once page 1 shows how many pages there are, the rest are requested
+            # together; they are still consumed in order below
+            prefetched = {}
+            pool = None
+            
+            try:
+                while page <= max_pages:
+                    current_url = page_url(page)
                     
-                    # If /list 404s, try fallback immediately
-                    if response.status_code == 404 and page == 1 and use_list_endpoint and not fallback_mode:
-                        fallback_mode = True
-                        continue
+                    try:
+                        future = prefetched.pop(page, None)
+                        if future is not None:
+                            response = future.result()
+                        else:
+                            response = self.session.get(current_url, timeout=REQUEST_TIMEOUT)
                         
-                    response.raise_for_status()
-                    
-                    soup = BeautifulSoup(response.text, "html.parser")
-                    
-                    # Find episode links - Method 1: Look for .allepcont .row > a
-                    episode_anchors = soup.select(".allepcont .row > a")
-                    
-                    # Method 2: Broader search if Method 1 fails
-                    if not episode_anchors:
-                        episode_anchors = soup.select(".allepcont a")
-                    
-                    # Method 3: Look for any links with episode indicators
-                    if not episode_anchors:
-                        episode_anchors = []
-                        for link in soup.find_all("a", href=True):
-                            title = link.get("title", "")
-                            text = link.get_text()
-                            href = link["href"]
+                        # If /list 404s, try fallback immediately
+                        if response.status_code == 404 and page == 1 and use_list_endpoint and not fallback_mode:
+                            fallback_mode = True
+                            continue
                             
-                            # Check if it looks like an episode link
-                            # Added: specific check for class "overlay" which is common in grid layouts
-                            if (link.select_one(".epnum") or 
-                                "الحلقة" in title or "Episode" in title or
-                                "الحلقة" in text or "Episode" in text or
-                                "episode" in href.lower() or 
-                                ("watch" in href and "button" in link.get("class", []))):
-                                episode_anchors.append(link)
+                        response.raise_for_status()
+                        
+                        soup = make_soup(response.text)
+                        if first_soup is None:
+                            first_soup = soup
+                            first_page = (current_url, _page_validator(response.headers))
+                            last_page = min(_last_page_number(soup), max_pages)
+                            if last_page > 2:
+                                from concurrent.futures import ThreadPoolExecutor
+                                pool = ThreadPoolExecutor(max_workers=min(_PAGE_FETCH_WORKERS, last_page - 1))
+                                prefetched = {
+                                    n: pool.submit(self.session.get, page_url(n), timeout=REQUEST_TIMEOUT)
+                                    for n in range(2, last_page + 1)
+                                }
+                        
+                        # Find episode links - Method 1: Look for .allepcont .row > a
+                        episode_anchors = soup.select(".allepcont .row > a")
+                        
+                        # Method 2: Broader search if Method 1 fails
+                        if not episode_anchors:
+                            episode_anchors = soup.select(".allepcont a")
+                        
+                        # Method 3: Look for any links with episode indicators
+                        if not episode_anchors:
+                            episode_anchors = []
+                            for link in soup.find_all("a", href=True):
+                                title = link.get("title", "")
+                                text = link.get_text()
+                                href = link["href"]
+                                
+                                # Check if it looks like an episode link
+                                # Added: specific check for class "overlay" which is common in grid layouts
+                                if (link.select_one(".epnum") or 
+                                    "الحلقة" in title or "Episode" in title or
+                                    "الحلقة" in text or "Episode" in text or
+                                    "episode" in href.lower() or 
+                                    ("watch" in href and "button" in link.get("class", []))):
+                                    episode_anchors.append(link)
+                                
+                                # Fallback for grid layouts where <a> wraps everything
+                                if not episode_anchors and ("anime" in href or "series" in href) and "watch" not in href:
+                                    # This handles cases where episodes are just listed as regular links in a grid
+                                    # But we must be careful not to pick up unrelated links
+                                    if _DIGITS_RE.search(text) or _DIGITS_RE.search(title):
+                                         # Weak check but might be necessary for some layouts
+                                         pass
+
+                        # SPECIAL FIX FOR TOPCINEMA ANIME SEASONS
+                        # Sometimes the season page lists episodes in `.Episodes--Seasons--Episodes a`
+                        if not episode_anchors:
+                             episode_anchors = soup.select(".Episodes--Seasons--Episodes a")
+
+                        # If no episodes found, we've reached the end
+                        if not episode_anchors:
+                            break
+                        
+                        # Parse episodes from this page
+                        page_episodes = []
+                        for anchor in episode_anchors:
+                            href = anchor.get("href")
+                            if not href or href in seen_urls:
+                                continue
+                            seen_urls.add(href)
                             
-                            # Fallback for grid layouts where <a> wraps everything
-                            if not episode_anchors and ("anime" in href or "series" in href) and "watch" not in href:
-                                # This handles cases where episodes are just listed as regular links in a grid
-                                # But we must be careful not to pick up unrelated links
-                                if re.search(r'\d+', text) or re.search(r'\d+', title):
-                                     # Weak check but might be necessary for some layouts
-                                     pass
-
-                    # SPECIAL FIX FOR TOPCINEMA ANIME SEASONS
-                    # Sometimes the season page lists episodes in `.Episodes--Seasons--Episodes a`
-                    if not episode_anchors:
-                         episode_anchors = soup.select(".Episodes--Seasons--Episodes a")
-
-                    # If no episodes found, we've reached the end
-                    if not episode_anchors:
-                        break
-                    
-                    # Parse episodes from this page
-                    page_episodes = []
-                    for anchor in episode_anchors:
-                        href = anchor.get("href")
-                        if not href or href in seen_urls:
-                            continue
-                        seen_urls.add(href)
+                            episode_data = self._parse_episode_link(anchor, href)
+                            if episode_data:
+                                page_episodes.append(episode_data)
                         
-                        episode_data = self._parse_episode_link(anchor, href)
-                        if episode_data:
-                            page_episodes.append(episode_data)
-                    
-                    # If no new episodes found, we're done
-                    if not page_episodes:
-                        break
-                    
-                    all_episodes.extend(page_episodes)
-                    
-                    # Check if there's a next page by looking for pagination
-                    next_page = soup.select_one('.page-numbers.next') or \
-                                soup.select_one(f'a[href*="page={page + 1}"]')
-                    
-                    if not next_page:
+                        # If no new episodes found, we're done
+                        if not page_episodes:
+                            break
+                        
+                        all_episodes.extend(page_episodes)
+                        
+                        # Check if there's a next page by looking for pagination
+                        next_page = soup.select_one('.page-numbers.next') or \
+                                    soup.select_one(f'a[href*="page={page + 1}"]')
+                        
+                        if not next_page:
+                            break
+                        
+                        page += 1
+                        
+                    except Exception as e:
+                        # If page fetch fails, stop pagination
+                        if page == 1:
+                            raise  # Re-raise if first page fails
                         break
-                    
-                    page += 1
-                    
-                except Exception as e:
-                    # If page fetch fails, stop pagination
-                    if page == 1:
-                        raise  # Re-raise if first page fails
-                    break
+            finally:
+                if pool is not None:
+                    for future in prefetched.values():
+                        future.cancel()
+                    pool.shutdown(wait=False)
             
             # Sort episodes by number
             all_episodes.sort(key=lambda e: parse_episode_number(e.get("episode_number", "")))
             
-            # Get poster from first page
-            response = self.session.get(base_url + '/', timeout=REQUEST_TIMEOUT)
-            soup = BeautifulSoup(response.text, "html.parser")
+            # Get poster from first page, the page already parsed above usually has it
+            poster_img = first_soup.find("img", class_=_POSTER_CLASS_RE) if first_soup is not None else None
+            if poster_img is None and (first_soup is None or not fallback_mode):
+                response = self.session.get(base_url + '/', timeout=REQUEST_TIMEOUT)
+                poster_img = make_soup(response.text).find("img", class_=_POSTER_CLASS_RE)
             poster = None
-            poster_img = soup.find("img", class_=re.compile("poster"))
             if poster_img:
                 poster = poster_img.get("data-src") or poster_img.get("src")
             
-            return {
+            result = {
                 "season_number": season_num,
                 "poster": poster,
                 "episodes": all_episodes
             }
+            if all_episodes and first_page:
+                _season_cache_put(season_url, {
+                    "timestamp": time.time(),
+                    "page_url": first_page[0],
+                    "validator": first_page[1],
+                    "result": result
+                })
+            return result
         
         except Exception as e:
             print(f"[WARN] Failed to parse season: {e}")
@@ -666,10 +1018,18 @@ class TopCinemaScraper:
             traceback.print_exc()
             return None
     
+    def _absolute_url(self, url: str) -> str:
+        # Links are almost always absolute or root-relative, which need no urljoin
+        if url.startswith(('http:', 'https:')):
+            return url
+        if url[:1] == '/' and url[:2] != '//':
+            return self.base_url + url
+        return urljoin(self._base_url_slash, url)
+
     def _parse_episode_link(self, link_elem, url: str) -> Optional[Dict]:
         try:
-            if url and not url.startswith(('http:', 'https:')):
-                url = urljoin(self.base_url, url)
+            if url:
+                url = self._absolute_url(url)
             
             if '/category/' in url or '/genre/' in url:
                 return None
@@ -677,38 +1037,36 @@ class TopCinemaScraper:
             ep_text = clean_text(link_elem.get_text())
             title_attr = link_elem.get("title", "")
             
-            # Try URL first (more reliable) - Arabic or English
-            ep_match = re.search(r'(?:الحلقة|episode|ep)[- ]?(\d+(?:\.\d+)?)', url, re.IGNORECASE)
-            
             # Detect special episodes
-            is_special = False
+            # One scan collects every special keyword in the URL; OVA beats Movie beats the rest
+            special_hits = {m.group(0).lower() for m in _SPECIAL_RE.finditer(url)}
+            is_special = bool(special_hits)
             special_type = None
-            if re.search(r'(?:ova|special|movie|خاص)', url, re.IGNORECASE):
-                is_special = True
-                if 'ova' in url.lower():
+            if is_special:
+                if 'ova' in special_hits:
                     special_type = 'OVA'
-                elif 'movie' in url.lower():
+                elif 'movie' in special_hits:
                     special_type = 'Movie'
                 else:
                     special_type = 'Special'
             
-            if not ep_match:
-                # Try title attribute with specific keywords FIRST
-                ep_match = re.search(r'(?:الحلقة|episode|ep)[- ]?(\d+(?:\.\d+)?)', title_attr, re.IGNORECASE)
-            
-            if not ep_match:
-                # Try text content with specific keywords FIRST
-                ep_match = re.search(r'(?:الحلقة|episode|ep)[- ]?(\d+(?:\.\d+)?)', ep_text, re.IGNORECASE)
+            # Try URL first (more reliable) - Arabic or English, then the title
+            # attribute and text content with the same keywords
+            ep_match = None
+            for candidate in (url, title_attr, ep_text):
+                ep_match = _EP_NUM_RE.search(candidate)
+                if ep_match:
+                    break
 
             if not ep_match:
                 # Fallback: Generic number search, BUT ignore Part/Season numbers
                 # This prevents "Part 2" from being parsed as "Episode 2"
-                clean_attr = re.sub(r'(?:part|season|الجزء|الموسم)[- ]?\d+', '', title_attr, flags=re.IGNORECASE)
-                ep_match = re.search(r'(\d+(?:\.\d+)?)', clean_attr)
+                clean_attr = _PART_STRIP_RE.sub('', title_attr)
+                ep_match = _NUMBER_RE.search(clean_attr)
 
             if not ep_match:
-                clean_text_val = re.sub(r'(?:part|season|الجزء|الموسم)[- ]?\d+', '', ep_text, flags=re.IGNORECASE)
-                ep_match = re.search(r'(\d+(?:\.\d+)?)', clean_text_val)
+                clean_text_val = _PART_STRIP_RE.sub('', ep_text)
+                ep_match = _NUMBER_RE.search(clean_text_val)
 
             # Handle episodes without numbers
             if not ep_match:
@@ -733,15 +1091,16 @@ class TopCinemaScraper:
             
             # Clean the title - remove episode numbers from title text
             clean_title = clean_arabic_title(ep_text or title_attr or "")
-            # Remove the episode number from title if it's just duplicating
-            clean_title = re.sub(r'\b' + re.escape(str(ep_num_str)) + r'\b', '', clean_title).strip()
-            if not clean_title or clean_title.isspace():
-                clean_title = ""
+            # Remove the episode number from title if it's just duplicating; most
+            # titles don't contain it at all, so the substring test skips the regex
+            if ep_num_str in clean_title:
+                clean_title = _ep_number_re(ep_num_str).sub('', clean_title).strip()
             
             # Don't fetch servers during initial parsing - do it lazily when needed
+            # Episode numbers repeat across every season and cached show, so intern them
             return {
-                "episode_number": ep_num_str,
-                "display_number": display_num,
+                "episode_number": sys.intern(ep_num_str),
+                "display_number": sys.intern(display_num),
                 "title": clean_title,
                 "url": url,
                 "is_special": is_special,
@@ -758,12 +1117,14 @@ class TopCinemaScraper:
         from .processor import VidTubeProcessor
         
         # Check if it's actually a vidtube domain
-        vidtube_domains = ['vidtube.one', 'vidtube.pro', 'vidtube.me', 'vidtube.to']
-        if not any(domain in embed_url.lower() for domain in vidtube_domains):
+        if not _VIDTUBE_RE.search(embed_url):
             return None
             
         try:
-            processor = VidTubeProcessor(self.session)
+            # Keep one processor per scraper instead of building one per embed
+            processor = getattr(self, "vidtube_processor", None)
+            if processor is None:
+                processor = self.vidtube_processor = VidTubeProcessor(self.session)
             referers = referers or []
             for ref in referers:
                 if ref:
@@ -777,69 +1138,134 @@ class TopCinemaScraper:
     def _encode_url(self, url: str) -> str:
         if not url:
             return url
+        # Plain ASCII paths with no query come back from quote() unchanged
+        if _PLAIN_URL_RE.fullmatch(url):
+            return url
         parts = urlsplit(url)
         path = quote(parts.path, safe="/")
         query = quote(parts.query, safe="=&?")
         return urlunsplit((parts.scheme, parts.netloc, path, query, parts.fragment))
 
     def _normalize_watch_url(self, url: str) -> str:
-        if not url:
-            return url
-        if url.endswith("/watch/"):
+        if not url or url.endswith("/watch/"):
             return url
-        if url.endswith("/"):
-            return f"{url}watch/"
-        return f"{url}/watch/"
+        return url.rstrip("/") + "/watch/"
 
-    def get_servers(self, content_id: str, referer: str, max_servers: int = 10) -> List[Dict]:
-        servers = []
-        
+    def _probe_server(self, content_id: str, index: int, headers: Dict) -> Optional[str]:
+        # Ask for one server slot, returns its embed URL when it is a VidTube iframe
+        try:
+            data = {"id": str(content_id), "i": str(index)}
+            response = self.session.post(
+                self._endpoints["server"],
+                headers=headers,
+                data=data,
+                timeout=5
+            )
+            
+            if response.status_code == 200:
+                html = response.text
+                match = _IFRAME_SRC_RE.search(html)
+                if match:
+                    embed_url = unescape(match.group(1)).strip()
+                elif "<iframe" in html.lower():
+                    # Unusual markup, let the parser have a go
+                    iframe = make_soup(html).find("iframe")
+                    embed_url = iframe.get("src", "").strip() if iframe else ""
+                else:
+                    return None
+                
+                if embed_url and _VIDTUBE_ANY_RE.search(embed_url):
+                    return embed_url
+        except Exception:
+            pass
+        return None
+    
+    def get_servers(self, content_id: str, referer: str, max_servers: int = 10,
+                    order: Optional[List[int]] = None) -> List[Dict]:
         headers = AJAX_HEADERS.copy()
         headers["Referer"] = referer
         headers["Origin"] = self.base_url
         
-        for i in range(max_servers):
-            try:
-                data = {"id": str(content_id), "i": str(i)}
-                response = self.session.post(
-                    self._get_endpoint("server"),
-                    headers=headers,
-                    data=data,
-                    timeout=5
-                )
+        # Probe the slots the page listed first; the list can be stale, so when
+        # none of them resolves fall back to the rest of 0..max_servers-1
+        listed = list(order)[:max_servers] if order else []
+        servers = self._probe_slots(content_id, listed, headers, referer)
+        if not servers:
+            rest = [i for i in range(max_servers) if i not in listed]
+            servers = self._probe_slots(content_id, rest, headers, referer)
+        return servers
+    
+    def _probe_slots(self, content_id: str, indices: List[int], headers: Dict,
+                     referer: str) -> List[Dict]:
+        servers = []
+        if not indices:
+            return servers
+        
+        # Probes run a few at a time ahead of the loop below, which still takes
+        # them in server order; the rest are cancelled once one resolves
+        from concurrent.futures import ThreadPoolExecutor
+        pool = ThreadPoolExecutor(max_workers=min(_SERVER_PROBE_WORKERS, len(indices)))
+        futures = [pool.submit(self._probe_server, content_id, i, headers) for i in indices]
+        try:
+            for i, future in zip(indices, futures):
+                embed_url = future.result()
+                if not embed_url:
+                    continue
                 
-                if response.status_code == 200:
-                    soup = BeautifulSoup(response.text, "html.parser")
-                    iframe = soup.find("iframe")
-                    
-                    if iframe and iframe.get("src"):
-                        embed_url = iframe["src"].strip()
-                        
-                        if 'vidtube' in embed_url.lower():
-                            # Extract actual video URL using script.mjs logic (internal method)
-                            referers = [self.base_url, referer, embed_url]
-                            video_url = self._extract_vidtube_url(embed_url, referers=referers)
-                            
-                            if video_url:
-                                servers.append({
-                                    "name": f"VidTube Server {i+1}",
-                                    "server_number": i,
-                                    "embed_url": embed_url,
-                                    "video_url": video_url
-                                })
-                                break
-                            
-            except Exception as e:
-                pass
+                # Extract actual video URL using script.mjs logic (internal method)
+                referers = [self.base_url, referer, embed_url]
+                video_url = self._extract_vidtube_url(embed_url, referers=referers)
+                
+                if video_url:
+                    servers.append({
+                        "name": sys.intern(f"VidTube Server {i+1}"),
+                        "server_number": i,
+                        "embed_url": embed_url,
+                        "video_url": video_url
+                    })
+                    break
+        finally:
+            for future in futures:
+                future.cancel()
+            pool.shutdown(wait=False)
         
         return servers
     
     def _extract_content_id(self, url: str, soup: Optional[BeautifulSoup] = None) -> Optional[str]:
+        # A page's content id never changes, so each URL is downloaded and scanned once
+        cached = self._content_ids.get(url)
+        if cached:
+            return cached[0]
+        
+        content_id = None
         try:
             if not soup:
                 response = self.session.get(url, timeout=REQUEST_TIMEOUT)
-                soup = BeautifulSoup(response.text, "html.parser")
-            
+                html = response.text
+                content_id, soup = _servers_list_id(html)
+                if not content_id:
+                    soup = make_soup(html)
+        except Exception:
+            return None
+        
+        if not content_id:
+            content_id = self._find_content_id(soup)
+        if content_id:
+            if len(self._content_ids) >= _CONTENT_ID_CACHE_MAX:
+                self._content_ids.clear()
+            self._content_ids[url] = (content_id, _server_slot_order(soup))
+        return content_id
+    
+    def _server_order(self, *urls: str) -> Optional[List[int]]:
+        # Slot order read from the server list of the first of these pages we scanned
+        for url in urls:
+            cached = self._content_ids.get(url)
+            if cached and cached[1]:
+                return cached[1]
+        return None
+    
+    def _find_content_id(self, soup: BeautifulSoup) -> Optional[str]:
+        try:
             # 1. Check for Li elements in the server list (MOST RELIABLE for movies)
             for selector in ["ul.servers-list li", ".server--item", "li[data-server]"]:
                 for li in soup.select(selector):
@@ -854,41 +1280,30 @@ class TopCinemaScraper:
             
             # 3. Look for postid class (WordPress common)
             # <div class="post-1234 ...">
-            for cls in soup.find_all(class_=re.compile(r"post-\d+")):
-                for c in cls.get("class", []):
-                    if c.startswith("post-"):
-                        try:
-                            pid = c.split("-")[1]
-                            if pid.isdigit():
-                                return pid
-                        except:
-                            pass
+            for elem in soup.find_all(class_=_POST_CLASS_RE):
+                for c in elem.get("class", []):
+                    match = _POST_CLASS_RE.match(c)
+                    if match:
+                        return match.group(1)
                             
             # 4. Fallback: search in scripts
-            scripts = soup.find_all("script")
-            for script in scripts:
+            # One pass per script; an id match (which also covers "post_id": 123 and
+            # var post_id = 123) wins, otherwise the first p=123 shortlink
+            for script in soup.find_all("script"):
                 if script.string:
-                    # id="123" or id='123'
-                    match = re.search(r'id["\']?\s*[:=]\s*["\']?(\d+)', script.string)
-                    if match:
-                        return match.group(1)
-                    # p=123 (shortlink in script)
-                    match = re.search(r'p=(\d+)', script.string)
-                    if match:
-                         return match.group(1)
-                    # "post_id": 123
-                    match = re.search(r'"post_id"\s*:\s*(\d+)', script.string)
-                    if match:
-                        return match.group(1)
-                    # var post_id = 123;
-                    match = re.search(r'var\s+post_id\s*=\s*(\d+)', script.string)
-                    if match:
-                        return match.group(1)
+                    shortlink_id = None
+                    for match in _SCRIPT_ID_RE.finditer(script.string):
+                        if match.group(1):
+                            return match.group(1)
+                        if shortlink_id is None:
+                            shortlink_id = match.group(2)
+                    if shortlink_id:
+                        return shortlink_id
 
             # 5. Check link rel=shortlink
             shortlink = soup.find("link", rel="shortlink")
             if shortlink and shortlink.get("href"):
-                 match = re.search(r'p=(\d+)', shortlink["href"])
+                 match = _SHORTLINK_ID_RE.search(shortlink["href"])
                  if match:
                      return match.group(1)
             
@@ -904,19 +1319,20 @@ class TopCinemaScraper:
     
     def _get_trailer_url(self, page_url: str, form_url: str) -> Optional[str]:
         try:
-            data = f"href={quote(form_url, safe=':/')}"
+            data = urlencode({"href": form_url})
             headers = AJAX_HEADERS.copy()
-            headers["Referer"] = quote(page_url, safe=':/')
+            # Header values must stay ASCII, so Arabic slugs still get percent-encoded
+            headers["Referer"] = self._encode_url(page_url)
             
             response = self.session.post(
-                self._get_endpoint("trailer"),
+                self._endpoints["trailer"],
                 headers=headers,
-                data=data.encode('utf-8'),
+                data=data.encode('ascii'),
                 timeout=REQUEST_TIMEOUT
             )
             response.raise_for_status()
             
-            soup = BeautifulSoup(response.text, "html.parser")
+            soup = make_soup(response.text)
             iframe = soup.find("iframe")
             
             if iframe and iframe.get("src"):
@@ -955,18 +1371,42 @@ class TopCinemaScraper:
 
         encoded_url = self._encode_url(url)
         watch_url = self._normalize_watch_url(encoded_url)
-        episode_id = self._extract_content_id(watch_url) or self._extract_content_id(encoded_url)
+        episode_id = self._extract_content_id(watch_url)
+        if not episode_id and encoded_url != watch_url:
+            # Links that already point at /watch/ would just download the same page again
+            episode_id = self._extract_content_id(encoded_url)
         if not episode_id:
             return []
 
-        servers = self.get_servers(episode_id, watch_url)
-        if not servers:
-            # Retry with a fresh session in case cookies/challenge state is stale.
-            fresh_scraper = TopCinemaScraper(base_url=self.base_url)
-            servers = fresh_scraper.get_servers(episode_id, watch_url)
+        order = self._server_order(watch_url, encoded_url)
+        attempted_at = time.monotonic()
+        servers = self.get_servers(episode_id, watch_url, order=order)
+        if not servers and self._refresh_cookies(attempted_at):
+            # Retry once cookies/challenge state has been renewed
+            servers = self.get_servers(episode_id, watch_url, order=order)
         episode["servers"] = servers
         return servers
     
+    def _refresh_cookies(self, since: float) -> bool:
+        # Renew the shared session's cookies in place instead of building a new
+        # session; episodes failing together only trigger one refresh. The jar is
+        # not cleared, other threads are mid-request on this session, Set-Cookie
+        # from the home page overwrites the stale values instead.
+        # True only when the cookies are newer than `since`, the caller's first
+        # attempt, so a retry never reuses the cookies that just failed
+        global _cookies_refreshed_at
+        with _refresh_lock:
+            if _cookies_refreshed_at > since:
+                return True
+            if time.monotonic() - _cookies_refreshed_at < COOKIE_REFRESH_INTERVAL:
+                return False
+            try:
+                self.session.get(self.base_url, timeout=REQUEST_TIMEOUT)
+            except Exception:
+                return False
+            _cookies_refreshed_at = time.monotonic()
+            return True
+    
     def search_movies(self, query: str) -> List[Dict]:
         return self.search(query, content_type="movie")
     